@@ -3,6 +3,7 @@
 """
 from dataclasses import dataclass
 from typing import Dict, Any
+import sys
 
 
 @dataclass
@@ -60,3 +61,7 @@ class PathConfig:
 # 全局配置实例
 GAME_CONFIG = GameConfig()
 PATH_CONFIG = PathConfig()
+
+# 数据类的 __slots__ 参数: Python 3.10+ 直接生成 __slots__, 更早的版本保持普通数据类
+# 用法: @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
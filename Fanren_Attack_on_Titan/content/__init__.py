@@ -7,6 +7,7 @@ from content.story_system import StorySystem, StoryChapter, StoryNotFoundError,
 from content.level_system import (
     LevelSystem, 
     LevelData, 
+    LevelMetadata,
     SpawnPoint, 
     Objective,
     ObjectiveType,
@@ -27,6 +28,7 @@ __all__ = [
     'ChapterNotFoundError',
     'LevelSystem',
     'LevelData',
+    'LevelMetadata',
     'SpawnPoint',
     'Objective',
     'ObjectiveType',
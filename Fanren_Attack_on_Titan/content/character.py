@@ -8,8 +8,41 @@ import os
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
+from config import DATACLASS_SLOTS
 
-@dataclass
+# orjson 为可选依赖，不可用时退回标准库 json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# 默认角色数据文件路径（导入时计算一次）
+_DEFAULT_DATA_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'data_files', 'characters.json'
+)
+
+# 按主要性格特征划分的反应模板
+_REACTION_TEMPLATES: Dict[str, str] = {
+    "热血": "[{name}] 握紧拳头，眼中燃烧着斗志。",
+    "冷静": "[{name}] 冷静地分析着当前的局势。",
+    "聪明": "[{name}] 快速思考着应对方案。",
+    "现实": "[{name}] 务实地评估着情况。",
+    "乐观": "[{name}] 保持着积极的态度。",
+    "贪吃": "[{name}] 下意识地摸了摸口袋里的食物。",
+    "可靠": "[{name}] 坚定地站在前方，准备承担责任。",
+    "内向": "[{name}] 安静地观察着周围的情况。",
+    "尖锐": "[{name}] 露出一丝讽刺的笑容。",
+    "温柔": "[{name}] 关切地看向同伴们。",
+    "温和": "[{name}] 试图安抚大家的情绪。",
+    "冷漠": "[{name}] 面无表情地注视着前方。",
+}
+_DEFAULT_REACTION_TEMPLATE = "[{name}] 做出了反应。"
+_NO_TRAIT_REACTION_TEMPLATE = "[{name}] 沉默不语。"
+
+
+@dataclass(**DATACLASS_SLOTS)
 class CharacterStats:
     """角色属性数据类"""
     speed: float          # 移动速度修正
@@ -45,6 +78,11 @@ class CharacterNotFoundError(Exception):
 class Character:
     """可玩角色定义"""
     
+    __slots__ = (
+        'id', 'name', 'name_en', 'portrait', 'model_path', 'stats',
+        'background', 'personality_traits', 'relationships'
+    )
+    
     # 角色数据文件路径
     _data_file_path: Optional[str] = None
     _characters_cache: Optional[Dict] = None
@@ -80,11 +118,7 @@ class Character:
     @classmethod
     def _get_data_file_path(cls) -> str:
         """获取角色数据文件路径"""
-        if cls._data_file_path:
-            return cls._data_file_path
-        # 默认路径
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        return os.path.join(base_dir, 'data_files', 'characters.json')
+        return cls._data_file_path or _DEFAULT_DATA_PATH
     
     @classmethod
     def _load_characters_data(cls) -> Dict:
@@ -94,8 +128,8 @@ class Character:
         
         data_path = cls._get_data_file_path()
         try:
-            with open(data_path, 'r', encoding='utf-8') as f:
-                cls._characters_cache = json.load(f)
+            with open(data_path, 'rb') as f:
+                cls._characters_cache = _json_loads(f.read())
                 return cls._characters_cache
         except FileNotFoundError:
             raise CharacterNotFoundError(f"角色数据文件未找到: {data_path}")
@@ -109,7 +143,12 @@ class Character:
     
     @staticmethod
     def load_from_json(character_id: str) -> 'Character':
-        """从JSON文件加载角色数据"""
+        """
+        从JSON文件加载角色数据
+        
+        JSON数据只解析一次并缓存，每次调用都根据缓存的数据创建新的角色对象，
+        调用方修改返回的角色不会影响其他调用方。
+        """
         characters_data = Character._load_characters_data()
         
         if character_id not in characters_data:
@@ -125,8 +164,8 @@ class Character:
             model_path=data.get('model', ''),
             stats=CharacterStats.from_dict(data.get('stats', {})),
             background=data.get('background', ''),
-            personality_traits=data.get('personality', []),
-            relationships=data.get('relationships', {})
+            personality_traits=list(data.get('personality', [])),
+            relationships=dict(data.get('relationships', {}))
         )
     
     @staticmethod
@@ -137,7 +176,11 @@ class Character:
     
     @staticmethod
     def get_all_characters() -> List['Character']:
-        """获取所有角色对象列表"""
+        """
+        获取所有角色对象列表
+        
+        每次返回新建的列表与角色对象，调用方修改不会影响其他调用方。
+        """
         character_ids = Character.get_all_character_ids()
         return [Character.load_from_json(cid) for cid in character_ids]
     
@@ -198,39 +241,29 @@ class Character:
         return self._generate_personality_based_reaction(event_id)
     
     def _generate_personality_based_reaction(self, event_id: str) -> str:
-        """基于性格特征生成反应"""
-        if not self.personality_traits:
-            return f"[{self.name}] 沉默不语。"
-        
-        # 根据主要性格特征生成反应模板
-        primary_trait = self.personality_traits[0]
-        
-        reaction_templates = {
-            "热血": f"[{self.name}] 握紧拳头，眼中燃烧着斗志。",
-            "冷静": f"[{self.name}] 冷静地分析着当前的局势。",
-            "聪明": f"[{self.name}] 快速思考着应对方案。",
-            "现实": f"[{self.name}] 务实地评估着情况。",
-            "乐观": f"[{self.name}] 保持着积极的态度。",
-            "贪吃": f"[{self.name}] 下意识地摸了摸口袋里的食物。",
-            "可靠": f"[{self.name}] 坚定地站在前方，准备承担责任。",
-            "内向": f"[{self.name}] 安静地观察着周围的情况。",
-            "尖锐": f"[{self.name}] 露出一丝讽刺的笑容。",
-            "温柔": f"[{self.name}] 关切地看向同伴们。",
-            "温和": f"[{self.name}] 试图安抚大家的情绪。",
-            "冷漠": f"[{self.name}] 面无表情地注视着前方。",
-        }
-        
-        return reaction_templates.get(
-            primary_trait, 
-            f"[{self.name}] 做出了反应。"
-        )
+        """基于主要性格特征生成反应（每次调用按当前名字和性格特征格式化）"""
+        traits = self.personality_traits
+        if not traits:
+            return _NO_TRAIT_REACTION_TEMPLATE.format(name=self.name)
+        template = _REACTION_TEMPLATES.get(traits[0], _DEFAULT_REACTION_TEMPLATE)
+        return template.format(name=self.name)
     
     def has_relationship_with(self, other_character_id: str) -> bool:
-        """检查是否与另一角色有关系"""
+        """
+        检查是否与另一角色有关系
+        
+        仅需判断时使用；若随后还要读取关系描述，请直接调用
+        get_relationship 并判断返回值是否为 None，避免重复查找。
+        """
         return other_character_id in self.relationships
     
     def get_relationship(self, other_character_id: str) -> Optional[str]:
-        """获取与另一角色的关系描述"""
+        """
+        获取与另一角色的关系描述
+        
+        Returns:
+            关系描述，无关系时返回 None（可同时用作存在性判断）
+        """
         return self.relationships.get(other_character_id)
     
     def to_dict(self) -> Dict:
@@ -9,15 +9,30 @@ Requirements:
     7.5 - 玩家死亡时显示游戏结束
 """
 
+import heapq
 import json
 import os
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Any, Callable
+from typing import Dict, List, Optional, Set, Any, Callable, Tuple
 from enum import Enum
 
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import PATH_CONFIG
+from config import PATH_CONFIG, DATACLASS_SLOTS
+
+# orjson 为可选依赖，不可用时退回标准库 json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def _normalize_position(position: List[float]) -> List[float]:
+    """补齐坐标为 [x, y, z], 缺少的分量按 0 处理"""
+    if len(position) >= 3:
+        return position
+    return list(position) + [0] * (3 - len(position))
 
 
 class ObjectiveType(Enum):
@@ -42,7 +57,12 @@ class LevelState(Enum):
     FAILED = "failed"
 
 
-@dataclass
+# 枚举值 -> 枚举成员查找表, 解析数据时用一次字典查找代替枚举构造和异常处理
+_OBJECTIVE_TYPE_BY_VALUE: Dict[str, ObjectiveType] = {t.value: t for t in ObjectiveType}
+_LEVEL_STATE_BY_VALUE: Dict[str, LevelState] = {state.value: state for state in LevelState}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class SpawnPoint:
     """
     巨人生成点数据类
@@ -56,10 +76,12 @@ class SpawnPoint:
     @staticmethod
     def from_dict(data: Dict) -> 'SpawnPoint':
         """从字典创建SpawnPoint"""
+        # 各 from_dict 均按字段声明顺序位置传参, 省去关键字参数的匹配开销
+        get = data.get
         return SpawnPoint(
-            position=data.get('position', [0, 0, 0]),
-            titan_type=data.get('titan_type', 'normal_3m'),
-            delay=float(data.get('delay', 0))
+            _normalize_position(get('position', [0, 0, 0])),
+            get('titan_type', 'normal_3m'),
+            float(get('delay', 0))
         )
     
     def to_dict(self) -> Dict:
@@ -71,7 +93,7 @@ class SpawnPoint:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Objective:
     """
     任务目标数据类
@@ -96,23 +118,20 @@ class Objective:
     @staticmethod
     def from_dict(data: Dict) -> 'Objective':
         """从字典创建Objective"""
-        obj_type_str = data.get('type', 'kill')
-        try:
-            obj_type = ObjectiveType(obj_type_str)
-        except ValueError:
-            obj_type = ObjectiveType.KILL
+        get = data.get
+        obj_type = _OBJECTIVE_TYPE_BY_VALUE.get(get('type', 'kill'), ObjectiveType.KILL)
         
         return Objective(
-            id=data.get('id', ''),
-            type=obj_type,
-            description=data.get('description', ''),
-            target=data.get('target', ''),
-            count=int(data.get('count', 0)),
-            time=float(data.get('time', 0)),
-            position=data.get('position', [0, 0, 0]),
-            radius=float(data.get('radius', 10)),
-            min_health=float(data.get('min_health', 0)),
-            damage_threshold=float(data.get('damage_threshold', 0))
+            get('id', ''),
+            obj_type,
+            get('description', ''),
+            get('target', ''),
+            int(get('count', 0)),
+            float(get('time', 0)),
+            get('position', [0, 0, 0]),
+            float(get('radius', 10)),
+            float(get('min_health', 0)),
+            float(get('damage_threshold', 0))
         )
     
     def to_dict(self) -> Dict:
@@ -133,7 +152,7 @@ class Objective:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EnvironmentConfig:
     """环境配置数据类"""
     buildings: bool = True
@@ -146,13 +165,14 @@ class EnvironmentConfig:
     @staticmethod
     def from_dict(data: Dict) -> 'EnvironmentConfig':
         """从字典创建EnvironmentConfig"""
+        get = data.get
         return EnvironmentConfig(
-            buildings=data.get('buildings', True),
-            walls=data.get('walls', True),
-            trees=data.get('trees', False),
-            tree_density=data.get('tree_density', 'medium'),
-            weather=data.get('weather', 'clear'),
-            time_of_day=data.get('time_of_day', 'afternoon')
+            get('buildings', True),
+            get('walls', True),
+            get('trees', False),
+            get('tree_density', 'medium'),
+            get('weather', 'clear'),
+            get('time_of_day', 'afternoon')
         )
     
     def to_dict(self) -> Dict:
@@ -167,7 +187,51 @@ class EnvironmentConfig:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
+class LevelMetadata:
+    """
+    关卡元数据类
+    只包含关卡列表等查询所需的顶层字段, 不解析生成点和目标
+    """
+    id: str
+    name: str
+    name_en: str
+    environment: str
+    description: str
+    chapter_id: str
+    difficulty: int
+    time_limit: float
+    
+    @staticmethod
+    def from_dict(data: Dict) -> 'LevelMetadata':
+        """从字典创建LevelMetadata"""
+        get = data.get
+        return LevelMetadata(
+            get('id', ''),
+            get('name', ''),
+            get('name_en', ''),
+            get('environment', ''),
+            get('description', ''),
+            get('chapter_id', ''),
+            int(get('difficulty', 1)),
+            float(get('time_limit', 600))
+        )
+    
+    def to_dict(self) -> Dict:
+        """转换为字典"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'name_en': self.name_en,
+            'environment': self.environment,
+            'description': self.description,
+            'chapter_id': self.chapter_id,
+            'difficulty': self.difficulty,
+            'time_limit': self.time_limit
+        }
+
+
+@dataclass(**DATACLASS_SLOTS)
 class LevelData:
     """
     关卡数据类
@@ -189,22 +253,23 @@ class LevelData:
     @staticmethod
     def from_dict(data: Dict) -> 'LevelData':
         """从字典创建LevelData"""
-        spawn_points = [SpawnPoint.from_dict(sp) for sp in data.get('spawn_points', [])]
-        objectives = [Objective.from_dict(obj) for obj in data.get('objectives', [])]
-        env_config = EnvironmentConfig.from_dict(data.get('environment_config', {}))
+        get = data.get
+        spawn_points = [SpawnPoint.from_dict(sp) for sp in get('spawn_points', [])]
+        objectives = [Objective.from_dict(obj) for obj in get('objectives', [])]
+        env_config = EnvironmentConfig.from_dict(get('environment_config', {}))
         
         return LevelData(
-            id=data.get('id', ''),
-            name=data.get('name', ''),
-            name_en=data.get('name_en', ''),
-            environment=data.get('environment', ''),
-            description=data.get('description', ''),
-            chapter_id=data.get('chapter_id', ''),
-            difficulty=int(data.get('difficulty', 1)),
-            spawn_points=spawn_points,
-            objectives=objectives,
-            time_limit=float(data.get('time_limit', 600)),
-            environment_config=env_config
+            get('id', ''),
+            get('name', ''),
+            get('name_en', ''),
+            get('environment', ''),
+            get('description', ''),
+            get('chapter_id', ''),
+            int(get('difficulty', 1)),
+            spawn_points,
+            objectives,
+            float(get('time_limit', 600)),
+            env_config
         )
     
     def to_dict(self) -> Dict:
@@ -224,7 +289,7 @@ class LevelData:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EnvironmentData:
     """环境数据类"""
     id: str
@@ -239,15 +304,16 @@ class EnvironmentData:
     @staticmethod
     def from_dict(data: Dict) -> 'EnvironmentData':
         """从字典创建EnvironmentData"""
+        get = data.get
         return EnvironmentData(
-            id=data.get('id', ''),
-            name=data.get('name', ''),
-            name_en=data.get('name_en', ''),
-            description=data.get('description', ''),
-            model_path=data.get('model_path', ''),
-            size=data.get('size', [500, 100, 500]),
-            features=data.get('features', []),
-            odm_anchor_density=data.get('odm_anchor_density', 'medium')
+            get('id', ''),
+            get('name', ''),
+            get('name_en', ''),
+            get('description', ''),
+            get('model_path', ''),
+            get('size', [500, 100, 500]),
+            get('features', []),
+            get('odm_anchor_density', 'medium')
         )
 
 
@@ -275,10 +341,17 @@ class LevelSystem:
     # 类级别的数据缓存
     _data_file_path: Optional[str] = None
     _level_cache: Optional[Dict] = None
+    # 已解析的关卡元数据缓存(关卡ID -> LevelMetadata), 仅供查询使用
+    _parsed_level_cache: Dict[str, LevelMetadata] = {}
+    # 全部关卡列表及按章节分组的缓存
+    _all_levels_cache: Optional[List[LevelMetadata]] = None
+    _levels_by_chapter: Optional[Dict[str, List[LevelMetadata]]] = None
+    # 已解析的环境数据缓存(环境ID -> EnvironmentData), 各实例共享只读引用
+    _environments_cache: Optional[Dict[str, EnvironmentData]] = None
     
     def __init__(self):
         self.current_level: Optional[LevelData] = None
-        self.active_titans: List[Any] = []  # 活跃的巨人实体列表
+        self.active_titans: Dict[int, Any] = {}  # 活跃的巨人实体(id(巨人) -> 巨人)
         self.objectives_completed: Set[str] = set()
         self.elapsed_time: float = 0.0
         self.level_state: LevelState = LevelState.NOT_LOADED
@@ -288,8 +361,22 @@ class LevelSystem:
         self.damage_dealt: float = 0.0
         self.player_health: float = 100.0
         
-        # 待生成的巨人队列
-        self._spawn_queue: List[SpawnPoint] = []
+        # 待生成的巨人队列: 按 (延迟, 序号, 生成点) 组织的最小堆
+        self._spawn_queue: List[Tuple[float, int, SpawnPoint]] = []
+        
+        # 伤害/保护目标按目标标识索引(供事件处理), 以及待完成目标的更新函数(供每帧更新)
+        self._damage_objs_by_target: Dict[str, List[Objective]] = {}
+        self._protect_objs_by_target: Dict[str, List[Objective]] = {}
+        self._pending_updaters: List[Callable[[float, Optional[List[float]]], bool]] = []
+        self._pending_objectives: List[Objective] = []
+        # 没有更新函数的目标(击败/调查/营救等), 由外部事件完成
+        self._external_objectives: List[Objective] = []
+        # 目标进度字典缓存(与当前关卡目标一一对应)
+        self._objective_progress_cache: List[Dict] = []
+        # 目标完成计数(完成不可撤销, 比较计数即可判断是否全部完成);
+        # 目标移出待完成列表时计入
+        self._objectives_total = 0
+        self._objectives_done = 0
         
         # 环境数据
         self._environments: Dict[str, EnvironmentData] = {}
@@ -308,6 +395,10 @@ class LevelSystem:
         """设置关卡数据文件路径"""
         cls._data_file_path = path
         cls._level_cache = None
+        cls._parsed_level_cache = {}
+        cls._all_levels_cache = None
+        cls._levels_by_chapter = None
+        cls._environments_cache = None
     
     @classmethod
     def _get_data_file_path(cls) -> str:
@@ -326,8 +417,8 @@ class LevelSystem:
         
         data_path = cls._get_data_file_path()
         try:
-            with open(data_path, 'r', encoding='utf-8') as f:
-                cls._level_cache = json.load(f)
+            with open(data_path, 'rb') as f:
+                cls._level_cache = _json_loads(f.read())
                 return cls._level_cache
         except FileNotFoundError:
             raise LevelNotFoundError(f"关卡数据文件未找到: {data_path}")
@@ -338,15 +429,27 @@ class LevelSystem:
     def clear_cache(cls) -> None:
         """清除关卡数据缓存"""
         cls._level_cache = None
+        cls._parsed_level_cache = {}
+        cls._all_levels_cache = None
+        cls._levels_by_chapter = None
+        cls._environments_cache = None
+    
+    @classmethod
+    def _get_environments(cls) -> Dict[str, EnvironmentData]:
+        """获取解析后的环境数据（带缓存）"""
+        if cls._environments_cache is None:
+            data = cls._load_raw_level_data()
+            cls._environments_cache = {
+                env_id: EnvironmentData.from_dict(env_data)
+                for env_id, env_data in data.get('environments', {}).items()
+            }
+        return cls._environments_cache
     
     def _load_level_data(self) -> None:
         """加载关卡数据"""
         try:
-            data = self._load_raw_level_data()
-            
-            # 加载环境数据
-            for env_id, env_data in data.get('environments', {}).items():
-                self._environments[env_id] = EnvironmentData.from_dict(env_data)
+            # 加载环境数据(各实例共享同一份)
+            self._environments = self._get_environments()
         except (LevelNotFoundError, LevelLoadError):
             # 如果文件不存在，使用空数据
             pass
@@ -390,9 +493,15 @@ class LevelSystem:
         for obj in self.current_level.objectives:
             obj.current_progress = 0.0
             obj.is_completed = False
+        self._index_objectives(self.current_level.objectives)
+        self._build_objective_progress_cache()
         
-        # 准备生成队列
-        self._spawn_queue = list(level_data.spawn_points)
+        # 准备生成队列(序号保证同一延迟按配置顺序生成)
+        self._spawn_queue = [
+            (spawn_point.delay, index, spawn_point)
+            for index, spawn_point in enumerate(level_data.spawn_points)
+        ]
+        heapq.heapify(self._spawn_queue)
         
         self.level_state = LevelState.ACTIVE
         return level_data
@@ -406,26 +515,20 @@ class LevelSystem:
             spawn_point: 生成点数据
             
         Returns:
-            生成的巨人实体（如果有回调则返回回调结果）
+            生成的巨人实体（如果有回调则返回回调结果，否则返回生成点本身）
             
         Requirements: 7.2 - 在指定位置生成巨人
         """
-        titan_info = {
-            'titan_type': spawn_point.titan_type,
-            'position': spawn_point.position,
-            'delay': spawn_point.delay
-        }
-        
-        # 触发生成回调
+        # 触发生成回调(直接传入生成点, 不再额外构造信息字典)
         if self._on_titan_spawn:
-            titan = self._on_titan_spawn(titan_info)
+            titan = self._on_titan_spawn(spawn_point)
             if titan:
-                self.active_titans.append(titan)
+                self.active_titans[id(titan)] = titan
             return titan
         
-        # 如果没有回调，只记录信息
-        self.active_titans.append(titan_info)
-        return titan_info
+        # 如果没有回调，只记录生成点
+        self.active_titans[id(spawn_point)] = spawn_point
+        return spawn_point
     
     def update(self, dt: float, player_position: List[float] = None) -> None:
         """
@@ -438,98 +541,193 @@ class LevelSystem:
         if self.level_state != LevelState.ACTIVE:
             return
         
-        if self.current_level is None:
+        level = self.current_level
+        if level is None:
             return
         
         # 更新时间
-        self.elapsed_time += dt
+        elapsed = self.elapsed_time + dt
+        self.elapsed_time = elapsed
         
         # 检查时间限制
-        if self.elapsed_time >= self.current_level.time_limit:
+        if elapsed >= level.time_limit:
             self.fail_level("时间耗尽")
             return
         
-        # 处理生成队列
-        self._process_spawn_queue()
+        # 处理生成队列(队首未到时间时无需调用)
+        queue = self._spawn_queue
+        if queue and queue[0][0] <= elapsed:
+            self._process_spawn_queue()
         
-        # 更新目标进度
-        self._update_objectives(dt, player_position)
+        # 更新目标进度(没有待完成目标时跳过)
+        if self._pending_updaters:
+            self._update_objectives(dt, player_position)
         
         # 检查目标完成
         if self.check_objectives():
             self.complete_level()
     
     def _process_spawn_queue(self) -> None:
-        """处理巨人生成队列"""
-        remaining = []
-        for spawn_point in self._spawn_queue:
-            if self.elapsed_time >= spawn_point.delay:
-                self.spawn_titan(spawn_point)
+        """处理巨人生成队列(只弹出已到时间的生成点)"""
+        queue = self._spawn_queue
+        while queue and queue[0][0] <= self.elapsed_time:
+            _, _, spawn_point = heapq.heappop(queue)
+            self.spawn_titan(spawn_point)
+    
+    def _index_objectives(self, objectives: List[Objective]) -> None:
+        """按目标标识索引伤害/保护目标, 并为可自动判定的目标预先生成更新函数"""
+        self._damage_objs_by_target = {}
+        self._protect_objs_by_target = {}
+        self._pending_updaters = []
+        self._pending_objectives = []
+        self._external_objectives = []
+        self._objectives_total = len(objectives)
+        self._objectives_done = 0
+        builders = self._OBJECTIVE_UPDATER_BUILDERS
+        for obj in objectives:
+            if obj.type == ObjectiveType.DAMAGE:
+                self._damage_objs_by_target.setdefault(obj.target, []).append(obj)
+            elif obj.type == ObjectiveType.PROTECT:
+                self._protect_objs_by_target.setdefault(obj.target, []).append(obj)
+            builder = builders.get(obj.type)
+            if builder is not None:
+                self._pending_updaters.append(builder(self, obj))
+                self._pending_objectives.append(obj)
             else:
-                remaining.append(spawn_point)
-        self._spawn_queue = remaining
+                self._external_objectives.append(obj)
     
     def _update_objectives(self, dt: float, player_position: List[float] = None) -> None:
         """更新目标进度"""
         if self.current_level is None:
             return
         
-        for obj in self.current_level.objectives:
+        # 更新函数返回 True 表示目标已完成, 完成后移出列表不再调用;
+        # 已由外部标记完成的目标同样移出
+        elapsed = self.elapsed_time
+        updaters = self._pending_updaters
+        objectives = self._pending_objectives
+        for i in range(len(updaters) - 1, -1, -1):
+            obj = objectives[i]
+            if obj.is_completed or updaters[i](elapsed, player_position):
+                self._mark_objective_completed(obj)
+                del updaters[i]
+                del objectives[i]
+    
+    # ==================== 目标更新函数 ====================
+    # 关卡加载时为每个目标生成一个闭包, 目标参数在生成时绑定,
+    # 每帧以 (已用时间, 玩家位置) 调用, 返回目标是否在本次调用中完成
+    
+    def _mark_objective_completed(self, obj: Objective) -> None:
+        """标记目标完成, 每个目标只计入一次完成数"""
+        obj.is_completed = True
+        if obj.id not in self.objectives_completed:
+            self.objectives_completed.add(obj.id)
+            self._objectives_done += 1
+    
+    def _collect_external_objectives(self) -> None:
+        """将外部直接标记 is_completed 的无更新函数目标计入完成数"""
+        external = self._external_objectives
+        for i in range(len(external) - 1, -1, -1):
+            obj = external[i]
             if obj.is_completed:
-                continue
-            
-            if obj.type == ObjectiveType.SURVIVE:
-                # 生存目标：累计时间
-                obj.current_progress = min(self.elapsed_time, obj.time)
-                if obj.current_progress >= obj.time:
-                    obj.is_completed = True
-                    self.objectives_completed.add(obj.id)
-            
-            elif obj.type == ObjectiveType.KILL:
-                # 击杀目标：检查击杀数
-                obj.current_progress = float(self.titans_killed)
-                if obj.current_progress >= obj.count:
-                    obj.is_completed = True
-                    self.objectives_completed.add(obj.id)
-            
-            elif obj.type == ObjectiveType.REACH and player_position:
-                # 到达目标：检查距离
-                distance = self._calculate_distance(player_position, obj.position)
-                if distance <= obj.radius:
-                    obj.is_completed = True
-                    obj.current_progress = 1.0
-                    self.objectives_completed.add(obj.id)
-            
-            elif obj.type == ObjectiveType.DAMAGE:
-                # 伤害目标：检查累计伤害
-                obj.current_progress = self.damage_dealt
-                if obj.current_progress >= obj.damage_threshold:
-                    obj.is_completed = True
-                    self.objectives_completed.add(obj.id)
-            
-            elif obj.type == ObjectiveType.PROTECT:
-                # 保护目标：检查目标生命值
-                # 这里需要外部更新 current_progress
-                if obj.current_progress >= obj.min_health:
-                    obj.is_completed = True
-                    self.objectives_completed.add(obj.id)
-            
-            elif obj.type == ObjectiveType.ESCAPE and player_position:
-                # 逃离目标：检查是否到达安全区域
-                distance = self._calculate_distance(player_position, obj.position)
-                if distance <= obj.radius:
-                    obj.is_completed = True
-                    obj.current_progress = 1.0
-                    self.objectives_completed.add(obj.id)
-
-    
-    def _calculate_distance(self, pos1: List[float], pos2: List[float]) -> float:
-        """计算两点之间的距离"""
-        import math
-        dx = pos1[0] - pos2[0]
-        dy = pos1[1] - pos2[1] if len(pos1) > 1 and len(pos2) > 1 else 0
-        dz = pos1[2] - pos2[2] if len(pos1) > 2 and len(pos2) > 2 else 0
-        return math.sqrt(dx * dx + dy * dy + dz * dz)
+                self._mark_objective_completed(obj)
+                del external[i]
+    
+    def _build_survive_updater(self, obj: Objective) -> Callable[[float, Optional[List[float]]], bool]:
+        """生存目标：累计时间"""
+        target_time = obj.time
+        complete = self._mark_objective_completed
+        
+        def update(elapsed: float, player_position: Optional[List[float]]) -> bool:
+            progress = elapsed if elapsed < target_time else target_time
+            obj.current_progress = progress
+            if progress >= target_time:
+                complete(obj)
+                return True
+            return False
+        return update
+    
+    def _build_kill_updater(self, obj: Objective) -> Callable[[float, Optional[List[float]]], bool]:
+        """击杀目标：检查击杀数"""
+        target_count = obj.count
+        complete = self._mark_objective_completed
+        level = self
+        
+        def update(elapsed: float, player_position: Optional[List[float]]) -> bool:
+            progress = float(level.titans_killed)
+            obj.current_progress = progress
+            if progress >= target_count:
+                complete(obj)
+                return True
+            return False
+        return update
+    
+    def _build_reach_updater(self, obj: Objective) -> Callable[[float, Optional[List[float]]], bool]:
+        """到达/逃离目标：检查是否进入目标区域"""
+        # 目标坐标按原样保存; 玩家与目标任一方缺少的分量不参与距离计算
+        position = obj.position
+        target_dims = len(position)
+        tx = position[0]
+        ty = position[1] if target_dims > 1 else 0
+        tz = position[2] if target_dims > 2 else 0
+        # 与半径的平方比较, 判定时省去开方
+        radius_sq = obj.radius * obj.radius
+        complete = self._mark_objective_completed
+        
+        def update(elapsed: float, player_position: Optional[List[float]]) -> bool:
+            if not player_position:
+                return False
+            n = len(player_position)
+            if n > target_dims:
+                n = target_dims
+            dx = player_position[0] - tx
+            dy = player_position[1] - ty if n > 1 else 0
+            dz = player_position[2] - tz if n > 2 else 0
+            if dx * dx + dy * dy + dz * dz <= radius_sq:
+                obj.current_progress = 1.0
+                complete(obj)
+                return True
+            return False
+        return update
+    
+    def _build_damage_updater(self, obj: Objective) -> Callable[[float, Optional[List[float]]], bool]:
+        """伤害目标：检查累计伤害"""
+        threshold = obj.damage_threshold
+        complete = self._mark_objective_completed
+        level = self
+        
+        def update(elapsed: float, player_position: Optional[List[float]]) -> bool:
+            progress = level.damage_dealt
+            obj.current_progress = progress
+            if progress >= threshold:
+                complete(obj)
+                return True
+            return False
+        return update
+    
+    def _build_protect_updater(self, obj: Objective) -> Callable[[float, Optional[List[float]]], bool]:
+        """保护目标：检查目标生命值(current_progress 由外部更新)"""
+        min_health = obj.min_health
+        complete = self._mark_objective_completed
+        
+        def update(elapsed: float, player_position: Optional[List[float]]) -> bool:
+            if obj.current_progress >= min_health:
+                complete(obj)
+                return True
+            return False
+        return update
+    
+    # 目标类型 -> 更新函数生成器, 没有生成器的类型由外部事件推进
+    _OBJECTIVE_UPDATER_BUILDERS: Dict[ObjectiveType, Callable[
+        ['LevelSystem', Objective], Callable[[float, Optional[List[float]]], bool]]] = {
+        ObjectiveType.SURVIVE: _build_survive_updater,
+        ObjectiveType.KILL: _build_kill_updater,
+        ObjectiveType.REACH: _build_reach_updater,
+        ObjectiveType.DAMAGE: _build_damage_updater,
+        ObjectiveType.PROTECT: _build_protect_updater,
+        ObjectiveType.ESCAPE: _build_reach_updater,
+    }
+
     
     def check_objectives(self) -> bool:
         """
@@ -543,11 +741,11 @@ class LevelSystem:
         if self.current_level is None:
             return False
         
-        for obj in self.current_level.objectives:
-            if not obj.is_completed:
-                return False
-        
-        return True
+        # 完成数在目标完成时累加; 带更新函数的目标若被直接标记 is_completed,
+        # 在下一次 update 的 _update_objectives 中计入
+        if self._external_objectives:
+            self._collect_external_objectives()
+        return self._objectives_done >= self._objectives_total
     
     def complete_level(self) -> Dict:
         """
@@ -640,9 +838,9 @@ class LevelSystem:
         """
         self.titans_killed += 1
         
-        # 从活跃列表中移除
-        if titan and titan in self.active_titans:
-            self.active_titans.remove(titan)
+        # 从活跃巨人中移除(按对象身份)
+        if titan:
+            self.active_titans.pop(id(titan), None)
     
     def on_damage_dealt(self, damage: float, target: str = "") -> None:
         """
@@ -655,10 +853,8 @@ class LevelSystem:
         self.damage_dealt += damage
         
         # 更新伤害目标进度
-        if self.current_level:
-            for obj in self.current_level.objectives:
-                if obj.type == ObjectiveType.DAMAGE and obj.target == target:
-                    obj.current_progress += damage
+        for obj in self._damage_objs_by_target.get(target, ()):
+            obj.current_progress += damage
     
     def on_player_damaged(self, damage: float) -> None:
         """
@@ -680,12 +876,31 @@ class LevelSystem:
             target: 目标标识
             current_health: 当前生命值
         """
-        if self.current_level:
-            for obj in self.current_level.objectives:
-                if obj.type == ObjectiveType.PROTECT and obj.target == target:
-                    obj.current_progress = current_health
-                    if current_health < obj.min_health:
-                        self.fail_level(f"保护目标 {target} 被摧毁")
+        for obj in self._protect_objs_by_target.get(target, ()):
+            obj.current_progress = current_health
+            if current_health < obj.min_health:
+                self.fail_level(f"保护目标 {target} 被摧毁")
+    
+    def complete_objective(self, objective_id: str) -> bool:
+        """
+        由外部事件完成指定目标(如击败、调查、营救目标)
+        
+        完成后的关卡结算在下一次 update 中进行
+        
+        Args:
+            objective_id: 目标ID
+            
+        Returns:
+            bool: 是否有目标因此被标记完成
+        """
+        if self.current_level is None:
+            return False
+        
+        for obj in self.current_level.objectives:
+            if obj.id == objective_id and not obj.is_completed:
+                self._mark_objective_completed(obj)
+                return True
+        return False
     
     # ==================== 回调设置 ====================
     
@@ -698,40 +913,68 @@ class LevelSystem:
         self._on_level_fail = callback
     
     def set_on_titan_spawn(self, callback: Callable) -> None:
-        """设置巨人生成回调"""
+        """设置巨人生成回调(回调参数为 SpawnPoint, 返回生成的巨人实体)"""
         self._on_titan_spawn = callback
     
     # ==================== 查询方法 ====================
     
-    def get_level_info(self, level_id: str) -> Optional[LevelData]:
+    def get_level_info(self, level_id: str) -> Optional[LevelMetadata]:
         """
         获取关卡信息（不加载）
         
+        只解析关卡的顶层字段, 生成点和目标留到 load_level 时再构建;
+        结果按关卡ID缓存, 多次查询返回同一对象, 调用方不应修改
+        
         Args:
             level_id: 关卡ID
             
         Returns:
-            LevelData对象，如果不存在则返回None
+            LevelMetadata对象，如果不存在则返回None
         """
+        cached = self._parsed_level_cache.get(level_id)
+        if cached is not None:
+            return cached
+        
         try:
             data = self._load_raw_level_data()
             levels = data.get('levels', {})
             if level_id in levels:
-                return LevelData.from_dict(levels[level_id])
+                metadata = LevelMetadata.from_dict(levels[level_id])
+                self._parsed_level_cache[level_id] = metadata
+                return metadata
         except (LevelNotFoundError, LevelLoadError):
             pass
         return None
     
-    def get_all_levels(self) -> List[LevelData]:
-        """获取所有关卡"""
+    @classmethod
+    def _load_level_indexes(cls) -> None:
+        """解析全部关卡元数据并按章节分组（带缓存）"""
+        if cls._all_levels_cache is not None:
+            return
+        
+        data = cls._load_raw_level_data()
+        all_levels: List[LevelMetadata] = []
+        levels_by_chapter: Dict[str, List[LevelMetadata]] = {}
+        for level_id, level_data in data.get('levels', {}).items():
+            metadata = cls._parsed_level_cache.get(level_id)
+            if metadata is None:
+                metadata = LevelMetadata.from_dict(level_data)
+                cls._parsed_level_cache[level_id] = metadata
+            all_levels.append(metadata)
+            levels_by_chapter.setdefault(metadata.chapter_id, []).append(metadata)
+        
+        cls._all_levels_cache = all_levels
+        cls._levels_by_chapter = levels_by_chapter
+    
+    def get_all_levels(self) -> List[LevelMetadata]:
+        """获取所有关卡的元数据(返回缓存列表的副本)"""
         try:
-            data = self._load_raw_level_data()
-            levels = data.get('levels', {})
-            return [LevelData.from_dict(level_data) for level_data in levels.values()]
+            self._load_level_indexes()
         except (LevelNotFoundError, LevelLoadError):
             return []
+        return list(self._all_levels_cache)
     
-    def get_levels_by_chapter(self, chapter_id: str) -> List[LevelData]:
+    def get_levels_by_chapter(self, chapter_id: str) -> List[LevelMetadata]:
         """
         获取指定章节的所有关卡
         
@@ -739,10 +982,13 @@ class LevelSystem:
             chapter_id: 章节ID
             
         Returns:
-            该章节的关卡列表
+            该章节的关卡元数据列表(缓存列表的副本)
         """
-        all_levels = self.get_all_levels()
-        return [level for level in all_levels if level.chapter_id == chapter_id]
+        try:
+            self._load_level_indexes()
+        except (LevelNotFoundError, LevelLoadError):
+            return []
+        return list(self._levels_by_chapter.get(chapter_id, ()))
     
     def get_environment(self, environment_id: str) -> Optional[EnvironmentData]:
         """
@@ -765,37 +1011,49 @@ class LevelSystem:
     
     # ==================== 进度和状态 ====================
     
+    def _build_objective_progress_cache(self) -> None:
+        """为当前关卡的每个目标预建进度字典, 静态字段只填写一次"""
+        self._objective_progress_cache = []
+        if self.current_level is None:
+            return
+        
+        for obj in self.current_level.objectives:
+            # 目标值
+            if obj.type == ObjectiveType.KILL:
+                target_value = obj.count
+            elif obj.type == ObjectiveType.SURVIVE:
+                target_value = obj.time
+            elif obj.type == ObjectiveType.DAMAGE:
+                target_value = obj.damage_threshold
+            else:
+                target_value = 1.0
+            
+            self._objective_progress_cache.append({
+                'id': obj.id,
+                'type': obj.type.value,
+                'description': obj.description,
+                'is_completed': obj.is_completed,
+                'current_progress': obj.current_progress,
+                'target_value': target_value
+            })
+    
     def get_objective_progress(self) -> List[Dict]:
         """
         获取所有目标的进度
         
+        返回的列表和字典在关卡加载时创建, 每次调用只刷新其中的动态字段;
+        需要保留某一时刻的进度时请自行复制
+        
         Returns:
             目标进度列表
         """
         if self.current_level is None:
             return []
         
-        progress_list = []
-        for obj in self.current_level.objectives:
-            progress = {
-                'id': obj.id,
-                'type': obj.type.value,
-                'description': obj.description,
-                'is_completed': obj.is_completed,
-                'current_progress': obj.current_progress
-            }
-            
-            # 添加目标值
-            if obj.type == ObjectiveType.KILL:
-                progress['target_value'] = obj.count
-            elif obj.type == ObjectiveType.SURVIVE:
-                progress['target_value'] = obj.time
-            elif obj.type == ObjectiveType.DAMAGE:
-                progress['target_value'] = obj.damage_threshold
-            else:
-                progress['target_value'] = 1.0
-            
-            progress_list.append(progress)
+        progress_list = self._objective_progress_cache
+        for obj, progress in zip(self.current_level.objectives, progress_list):
+            progress['is_completed'] = obj.is_completed
+            progress['current_progress'] = obj.current_progress
         
         return progress_list
     
@@ -831,6 +1089,14 @@ class LevelSystem:
         self.damage_dealt = 0.0
         self.player_health = 100.0
         self._spawn_queue.clear()
+        self._damage_objs_by_target.clear()
+        self._protect_objs_by_target.clear()
+        self._pending_updaters.clear()
+        self._pending_objectives.clear()
+        self._external_objectives.clear()
+        self._objective_progress_cache = []
+        self._objectives_total = 0
+        self._objectives_done = 0
     
     def to_save_data(self) -> Dict:
         """转换为存档数据"""
@@ -859,11 +1125,9 @@ class LevelSystem:
                 level_system.player_health = save_data.get('player_health', 100.0)
                 level_system.objectives_completed = set(save_data.get('objectives_completed', []))
                 
-                state_str = save_data.get('level_state', 'active')
-                try:
-                    level_system.level_state = LevelState(state_str)
-                except ValueError:
-                    level_system.level_state = LevelState.ACTIVE
+                level_system.level_state = _LEVEL_STATE_BY_VALUE.get(
+                    save_data.get('level_state', 'active'), LevelState.ACTIVE
+                )
             except LevelNotFoundError:
                 pass
         
@@ -10,7 +10,8 @@ from .scene_manager import (
     LoadingScreen, 
     LoadingTask, 
     LoadingProgress,
-    LoadingState
+    LoadingState,
+    LoadingStage
 )
 from .game_controller import GameController
 
@@ -28,5 +29,6 @@ __all__ = [
     'LoadingTask',
     'LoadingProgress',
     'LoadingState',
+    'LoadingStage',
     'GameController'
 ]
@@ -171,6 +171,7 @@ class GameController:
     
     def _on_quit(self) -> None:
         """退出游戏"""
+        self.scene_manager.shutdown()
         self.game_manager.quit()
     
     def _on_character_selected(self, character_id: str) -> None:
@@ -563,6 +564,9 @@ class GameController:
             # 更新关卡
             self.level_system.update(dt)
         
+        # 处理场景的分派加载任务
+        self.scene_manager.update()
+        
         # 更新对话系统
         self.dialogue_system.update(dt)
     
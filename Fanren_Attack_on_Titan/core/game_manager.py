@@ -2,8 +2,12 @@
 游戏状态管理器
 负责管理游戏全局状态和流程控制
 """
+import logging
 from enum import Enum
-from typing import Optional, Callable, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Callable, Dict, Any, FrozenSet, List, Mapping, Tuple
+
+logger = logging.getLogger(__name__)
 
 
 class GameState(Enum):
@@ -17,6 +21,27 @@ class GameState(Enum):
     RESULTS = "results"
 
 
+# 每个状态的连续序号(按定义顺序), 回调表与转换位掩码均按序号索引
+_STATE_INDEX: Dict[GameState, int] = {state: index for index, state in enumerate(GameState)}
+
+
+def _build_transition_masks(
+    transitions: Mapping[GameState, FrozenSet[GameState]]
+) -> Tuple[int, ...]:
+    """
+    将状态转换表编码为位掩码
+    
+    返回值以源状态序号为下标, 目标状态合法时对应序号的位为 1
+    """
+    masks = []
+    for state in GameState:
+        mask = 0
+        for target in transitions.get(state, ()):
+            mask |= 1 << _STATE_INDEX[target]
+        masks.append(mask)
+    return tuple(masks)
+
+
 class GameManager:
     """
     游戏全局状态管理器
@@ -28,16 +53,28 @@ class GameManager:
     - 管理分数系统
     """
     
-    # 有效的状态转换映射
-    VALID_TRANSITIONS: Dict[GameState, set] = {
-        GameState.MAIN_MENU: {GameState.CHARACTER_SELECT, GameState.GAMEPLAY},
-        GameState.CHARACTER_SELECT: {GameState.MAIN_MENU, GameState.GAMEPLAY, GameState.CUTSCENE},
-        GameState.GAMEPLAY: {GameState.PAUSED, GameState.CUTSCENE, GameState.GAME_OVER, GameState.RESULTS},
-        GameState.CUTSCENE: {GameState.GAMEPLAY, GameState.RESULTS},
-        GameState.PAUSED: {GameState.GAMEPLAY, GameState.MAIN_MENU},
-        GameState.GAME_OVER: {GameState.MAIN_MENU, GameState.GAMEPLAY},
-        GameState.RESULTS: {GameState.MAIN_MENU, GameState.GAMEPLAY, GameState.CHARACTER_SELECT},
-    }
+    # 有效的状态转换映射(只读); 子类可整体覆盖, 位掩码随类重新生成
+    VALID_TRANSITIONS: Mapping[GameState, FrozenSet[GameState]] = MappingProxyType({
+        GameState.MAIN_MENU: frozenset({GameState.CHARACTER_SELECT, GameState.GAMEPLAY}),
+        GameState.CHARACTER_SELECT: frozenset({GameState.MAIN_MENU, GameState.GAMEPLAY, GameState.CUTSCENE}),
+        GameState.GAMEPLAY: frozenset({GameState.PAUSED, GameState.CUTSCENE, GameState.GAME_OVER, GameState.RESULTS}),
+        GameState.CUTSCENE: frozenset({GameState.GAMEPLAY, GameState.RESULTS}),
+        GameState.PAUSED: frozenset({GameState.GAMEPLAY, GameState.MAIN_MENU}),
+        GameState.GAME_OVER: frozenset({GameState.MAIN_MENU, GameState.GAMEPLAY}),
+        GameState.RESULTS: frozenset({GameState.MAIN_MENU, GameState.GAMEPLAY, GameState.CHARACTER_SELECT}),
+    })
+    
+    # VALID_TRANSITIONS 的位掩码形式, 供 change_state 校验使用
+    _TRANSITION_MASKS: Tuple[int, ...] = _build_transition_masks(VALID_TRANSITIONS)
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """子类覆盖 VALID_TRANSITIONS 时冻结该映射并重新生成位掩码"""
+        super().__init_subclass__(**kwargs)
+        transitions = cls.VALID_TRANSITIONS
+        if not isinstance(transitions, MappingProxyType):
+            transitions = MappingProxyType(dict(transitions))
+            cls.VALID_TRANSITIONS = transitions
+        cls._TRANSITION_MASKS = _build_transition_masks(transitions)
     
     def __init__(self):
         """初始化游戏管理器"""
@@ -48,8 +85,8 @@ class GameManager:
         self._score: int = 0
         self._is_running: bool = False
         
-        # 状态变化回调
-        self._state_callbacks: Dict[GameState, list] = {state: [] for state in GameState}
+        # 状态变化回调, 以 GameState 序号为下标
+        self._state_callbacks: List[List[Callable[[], None]]] = [[] for _ in GameState]
     
     @property
     def current_state(self) -> GameState:
@@ -90,13 +127,15 @@ class GameManager:
             
         Returns:
             bool: 状态切换是否成功
+            
+        Raises:
+            ValueError: new_state 不是 GameState
         """
         if not isinstance(new_state, GameState):
             raise ValueError(f"Invalid state type: {type(new_state)}")
         
         # 检查是否是有效的状态转换
-        valid_targets = self.VALID_TRANSITIONS.get(self._current_state, set())
-        if new_state not in valid_targets:
+        if not (self._TRANSITION_MASKS[_STATE_INDEX[self._current_state]] >> _STATE_INDEX[new_state]) & 1:
             return False
         
         # 执行状态切换
@@ -204,16 +243,16 @@ class GameManager:
             state: 触发回调的状态
             callback: 回调函数
         """
-        if state in self._state_callbacks:
-            self._state_callbacks[state].append(callback)
+        if isinstance(state, GameState):
+            self._state_callbacks[_STATE_INDEX[state]].append(callback)
     
     def _trigger_callbacks(self, state: GameState) -> None:
         """触发指定状态的所有回调"""
-        for callback in self._state_callbacks.get(state, []):
+        for callback in self._state_callbacks[_STATE_INDEX[state]]:
             try:
                 callback()
-            except Exception as e:
-                print(f"Callback error for state {state}: {e}")
+            except Exception:
+                logger.exception("Callback error for state %s", state)
     
     def run(self) -> None:
         """
@@ -221,8 +260,8 @@ class GameManager:
         注意: 实际的Ursina游戏循环将在后续实现
         """
         self._is_running = True
-        print("游戏管理器已启动")
-        print(f"当前状态: {self._current_state.value}")
+        logger.info("游戏管理器已启动")
+        logger.info("当前状态: %s", self._current_state.value)
         
         # 这里将来会集成Ursina的app.run()
         # 目前仅作为占位
@@ -230,4 +269,4 @@ class GameManager:
     def quit(self) -> None:
         """退出游戏"""
         self._is_running = False
-        print("游戏已退出")
+        logger.info("游戏已退出")
@@ -6,10 +6,15 @@ Requirements:
     7.1 - 关卡加载时生成对应环境
 """
 from enum import Enum
-from typing import Optional, Callable, Dict, Any, List
+from typing import Optional, Callable, Dict, Any, List, Tuple, Union
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import random
 import time
 
+from config import DATACLASS_SLOTS
+
 
 class SceneType(Enum):
     """场景类型枚举"""
@@ -23,6 +28,10 @@ class SceneType(Enum):
     LOADING = "loading"
 
 
+# 每个场景类型的连续序号(按定义顺序), 回调表按序号索引
+_SCENE_TYPE_INDEX: Dict[SceneType, int] = {scene_type: index for index, scene_type in enumerate(SceneType)}
+
+
 class LoadingState(Enum):
     """加载状态枚举"""
     IDLE = "idle"
@@ -31,7 +40,13 @@ class LoadingState(Enum):
     ERROR = "error"
 
 
-@dataclass
+class LoadingStage(Enum):
+    """加载任务的执行阶段"""
+    MAIN = "main"  # 主线程执行(场景图、GPU 资源等只能在主线程操作的任务)
+    IO = "io"      # I/O 线程池执行(读取文件等)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class LoadingTask:
     """加载任务数据类"""
     name: str
@@ -39,9 +54,48 @@ class LoadingTask:
     weight: float = 1.0  # 任务权重，用于计算进度
     completed: bool = False
     error: Optional[str] = None
+    stage: LoadingStage = LoadingStage.MAIN  # 注册了任务加载器时的执行阶段
+
+
+# 默认加载任务模板: (任务名, 描述, 权重, 执行阶段)
+# 任务在加载过程中会被修改, 每次加载时按模板创建新的 LoadingTask
+_LoadingTaskTemplate = Tuple[Tuple[str, str, float, LoadingStage], ...]
+
+_DEFAULT_LOADING_TASKS: Dict[SceneType, _LoadingTaskTemplate] = {
+    SceneType.GAMEPLAY: (
+        ("unload", "卸载当前场景...", 0.5, LoadingStage.MAIN),
+        ("environment", "加载环境...", 2.0, LoadingStage.IO),
+        ("titans", "生成巨人...", 1.5, LoadingStage.MAIN),
+        ("player", "初始化玩家...", 1.0, LoadingStage.MAIN),
+        ("ui", "准备界面...", 0.5, LoadingStage.MAIN),
+    ),
+    SceneType.CUTSCENE: (
+        ("unload", "准备过场动画...", 0.5, LoadingStage.MAIN),
+        ("assets", "加载资源...", 1.0, LoadingStage.IO),
+        ("dialogue", "加载对话...", 0.5, LoadingStage.IO),
+    ),
+}
+# 其他场景类型的默认加载任务
+_FALLBACK_LOADING_TASKS: _LoadingTaskTemplate = (
+    ("init", "初始化...", 1.0, LoadingStage.MAIN),
+)
+# LoadingScreen 未指定任务时的默认任务
+_LOADING_SCREEN_TASKS: _LoadingTaskTemplate = (
+    ("init", "初始化...", 1.0, LoadingStage.MAIN),
+    ("assets", "加载资源...", 1.0, LoadingStage.MAIN),
+    ("scene", "构建场景...", 1.0, LoadingStage.MAIN),
+)
+
+
+def _build_loading_tasks(template: _LoadingTaskTemplate) -> List[LoadingTask]:
+    """按模板创建加载任务列表"""
+    return [
+        LoadingTask(name, description, weight, False, None, stage)
+        for name, description, weight, stage in template
+    ]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LoadingProgress:
     """加载进度数据类"""
     current_task: str = ""
@@ -64,15 +118,19 @@ class LoadingProgress:
         }
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SceneData:
-    """场景数据类"""
+    """场景数据类(创建后不可修改)"""
     scene_type: SceneType
     scene_id: str = ""
     params: Dict[str, Any] = field(default_factory=dict)
     
     def to_dict(self) -> Dict[str, Any]:
-        """转换为字典"""
+        """
+        转换为字典
+        
+        每次返回新的外层字典; params 直接引用场景参数(不复制), 与场景数据共享
+        """
         return {
             'scene_type': self.scene_type.value,
             'scene_id': self.scene_id,
@@ -99,6 +157,9 @@ class LoadingScreen:
         "完成任务目标才能通关。",
     ]
     
+    # 提示选择所用的随机数生成器, 所有加载画面共享
+    _tip_random: random.Random = random.Random()
+    
     def __init__(self):
         """初始化加载画面"""
         self.visible: bool = False
@@ -108,6 +169,14 @@ class LoadingScreen:
         # 加载任务队列
         self._tasks: List[LoadingTask] = []
         self._current_task_index: int = 0
+        # 任务权重在加载期间不变, 总权重与名称索引在开始加载时计算一次
+        self._total_weight: float = 0.0
+        self._task_by_name: Dict[str, LoadingTask] = {}
+        self._completed_count: int = 0
+        self._completed_weight: float = 0.0
+        # 各任务的渲染数据, 开始加载时创建, 任务状态变化时原地更新
+        self._task_render_list: List[Dict[str, Any]] = []
+        self._task_render_by_name: Dict[str, Dict[str, Any]] = {}
         
         # 当前提示
         self._current_tip: str = ""
@@ -120,6 +189,15 @@ class LoadingScreen:
         # 最小显示时间（秒），避免加载画面闪烁
         self._min_display_time: float = 0.5
         self._start_time: float = 0.0
+        
+        # 渲染数据缓存: 加载状态只在少数方法中变化, 其余帧直接复用
+        self._render_cache: Optional[Dict[str, Any]] = None
+        self._progress_cache: Optional[Dict[str, Any]] = None
+    
+    def _invalidate_cache(self) -> None:
+        """加载状态变化后清除渲染数据缓存"""
+        self._render_cache = None
+        self._progress_cache = None
     
     def start_loading(self, tasks: List[LoadingTask] = None) -> None:
         """
@@ -136,18 +214,36 @@ class LoadingScreen:
             self._tasks = tasks
         else:
             # 默认任务
-            self._tasks = [
-                LoadingTask("init", "初始化..."),
-                LoadingTask("assets", "加载资源..."),
-                LoadingTask("scene", "构建场景...")
-            ]
+            self._tasks = _build_loading_tasks(_LOADING_SCREEN_TASKS)
         
         self._current_task_index = 0
+        self._total_weight = sum(task.weight for task in self._tasks)
+        # 反向构建, 重名时与原先的顺序查找一致, 取第一个同名任务
+        self._task_by_name = {task.name: task for task in reversed(self._tasks)}
+        self._completed_count = 0
+        self._completed_weight = 0.0
+        for task in self._tasks:
+            if task.completed:
+                self._completed_count += 1
+                self._completed_weight += task.weight
+        self._task_render_list = [
+            {
+                'name': task.name,
+                'description': task.description,
+                'completed': task.completed,
+                'error': task.error
+            }
+            for task in self._tasks
+        ]
+        # 与 _task_by_name 一致, 重名时取第一个同名任务
+        self._task_render_by_name = {
+            task_dict['name']: task_dict for task_dict in reversed(self._task_render_list)
+        }
         self._update_progress()
         
         # 选择随机提示
-        import random
-        self._current_tip = random.choice(self.LOADING_TIPS)
+        self._current_tip = self._tip_random.choice(self.LOADING_TIPS)
+        self._invalidate_cache()
     
     def complete_task(self, task_name: str) -> None:
         """
@@ -156,15 +252,17 @@ class LoadingScreen:
         Args:
             task_name: 任务名称
         """
-        for task in self._tasks:
-            if task.name == task_name:
-                task.completed = True
-                break
+        task = self._task_by_name.get(task_name)
+        if task is not None and not task.completed:
+            task.completed = True
+            self._completed_count += 1
+            self._completed_weight += task.weight
+            self._task_render_by_name[task_name]['completed'] = True
         
         self._update_progress()
         
         # 检查是否全部完成
-        if all(task.completed for task in self._tasks):
+        if self._completed_count == len(self._tasks):
             self._check_complete()
     
     def set_task_error(self, task_name: str, error: str) -> None:
@@ -175,35 +273,43 @@ class LoadingScreen:
             task_name: 任务名称
             error: 错误信息
         """
-        for task in self._tasks:
-            if task.name == task_name:
-                task.error = error
-                break
+        task = self._task_by_name.get(task_name)
+        if task is not None:
+            task.error = error
+            self._task_render_by_name[task_name]['error'] = error
         
         self.state = LoadingState.ERROR
         self.progress.error_message = error
+        self._invalidate_cache()
         
         if self._on_error_callback:
             self._on_error_callback(error)
     
     def _update_progress(self) -> None:
         """更新进度"""
+        self._invalidate_cache()
         if not self._tasks:
             return
         
-        total_weight = sum(task.weight for task in self._tasks)
-        completed_weight = sum(task.weight for task in self._tasks if task.completed)
-        
-        self.progress.progress = completed_weight / total_weight if total_weight > 0 else 0.0
-        self.progress.tasks_completed = sum(1 for task in self._tasks if task.completed)
-        self.progress.total_tasks = len(self._tasks)
-        
-        # 找到当前任务
-        for task in self._tasks:
-            if not task.completed:
-                self.progress.current_task = task.name
-                self.progress.current_description = task.description
-                break
+        # 已完成权重和数量在完成任务时累加, 无需每次遍历任务列表
+        tasks = self._tasks
+        total_weight = self._total_weight
+        progress = self.progress
+        progress.progress = self._completed_weight / total_weight if total_weight > 0 else 0.0
+        progress.tasks_completed = self._completed_count
+        progress.total_tasks = len(tasks)
+        
+        # 当前任务: 第一个未完成的任务. 已完成的任务不会再变回未完成,
+        # 索引只需向后推进, 整个加载过程总计只遍历一次任务列表
+        index = self._current_task_index
+        count = len(tasks)
+        while index < count and tasks[index].completed:
+            index += 1
+        self._current_task_index = index
+        if index < count:
+            current_task = tasks[index]
+            progress.current_task = current_task.name
+            progress.current_description = current_task.description
     
     def _check_complete(self) -> None:
         """检查是否可以完成加载"""
@@ -220,6 +326,7 @@ class LoadingScreen:
         """完成加载"""
         self.state = LoadingState.COMPLETE
         self.progress.progress = 1.0
+        self._invalidate_cache()
         
         if self._on_complete_callback:
             self._on_complete_callback()
@@ -230,6 +337,13 @@ class LoadingScreen:
         self.state = LoadingState.IDLE
         self._tasks.clear()
         self._current_task_index = 0
+        self._total_weight = 0.0
+        self._task_by_name = {}
+        self._completed_count = 0
+        self._completed_weight = 0.0
+        self._task_render_list = []
+        self._task_render_by_name = {}
+        self._invalidate_cache()
     
     def set_on_complete_callback(self, callback: Callable) -> None:
         """设置完成回调"""
@@ -243,29 +357,39 @@ class LoadingScreen:
         """获取当前提示"""
         return self._current_tip
     
+    def get_progress_dict(self) -> Dict[str, Any]:
+        """
+        获取进度字典(带缓存)
+        
+        Returns:
+            dict: 与 progress.to_dict() 相同, 状态未变化时返回同一对象
+        """
+        if self._progress_cache is None:
+            self._progress_cache = self.progress.to_dict()
+        return self._progress_cache
+    
     def render(self) -> Dict[str, Any]:
         """
         渲染加载画面
         
+        加载状态未变化时返回上一次的渲染数据; 任务列表在整个加载过程中
+        原地更新并复用. 调用方不应修改返回的数据
+        
         Returns:
             dict: 渲染数据
         """
-        return {
+        if self._render_cache is not None:
+            return self._render_cache
+        
+        self._render_cache = {
             'type': 'loading_screen',
             'visible': self.visible,
             'state': self.state.value,
-            'progress': self.progress.to_dict(),
+            'progress': self.get_progress_dict(),
             'tip': self._current_tip,
-            'tasks': [
-                {
-                    'name': task.name,
-                    'description': task.description,
-                    'completed': task.completed,
-                    'error': task.error
-                }
-                for task in self._tasks
-            ]
+            'tasks': self._task_render_list
         }
+        return self._render_cache
 
 
 class SceneManager:
@@ -289,9 +413,10 @@ class SceneManager:
         self.loading_screen.set_on_complete_callback(self._on_loading_complete)
         
         # 场景切换回调
-        self._scene_callbacks: Dict[SceneType, List[Callable]] = {
-            scene_type: [] for scene_type in SceneType
-        }
+        # 以 SceneType 序号为下标
+        self._scene_callbacks: List[List[Callable[[SceneData], None]]] = [
+            [] for _ in SceneType
+        ]
         
         # 场景加载器
         self._scene_loaders: Dict[SceneType, Callable] = {}
@@ -299,6 +424,17 @@ class SceneManager:
         # 场景卸载器
         self._scene_unloaders: Dict[SceneType, Callable] = {}
         
+        # 按任务拆分的加载器(场景类型 -> 任务名 -> 加载器), 按任务阶段分派执行
+        self._task_loaders: Dict[SceneType, Dict[str, Callable[[SceneData], None]]] = {}
+        # I/O 线程池, 首次分派 IO 任务时创建并在之后的加载中复用
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        # 后台任务完成队列: (加载批次, 任务名, 错误信息), 由主线程在 update 中处理
+        self._completion_queue: "queue.Queue[Tuple[int, str, Optional[str]]]" = queue.Queue()
+        # 待在主线程执行的任务加载器, update 每次执行一个
+        self._main_thread_tasks: List[Tuple[str, Callable[[SceneData], None]]] = []
+        self._loading_scene: Optional[SceneData] = None
+        self._load_generation: int = 0
+        
         # 通用回调
         self._on_scene_change_callback: Optional[Callable[[SceneData, SceneData], None]] = None
         self._on_scene_loaded_callback: Optional[Callable[[SceneData], None]] = None
@@ -320,7 +456,7 @@ class SceneManager:
     
     def change_scene(
         self,
-        scene_type: SceneType,
+        scene_type: Union[SceneType, SceneData],
         scene_id: str = "",
         params: Dict[str, Any] = None,
         show_loading: bool = True,
@@ -330,27 +466,31 @@ class SceneManager:
         切换场景
         
         Args:
-            scene_type: 目标场景类型
+            scene_type: 目标场景类型, 或已构建好的场景数据(此时忽略 scene_id 与 params)
             scene_id: 场景ID（如关卡ID）
             params: 场景参数
             show_loading: 是否显示加载画面
             loading_tasks: 自定义加载任务
         """
-        if params is None:
-            params = {}
+        # 放弃尚未完成的分派加载
+        self._cancel_task_loading()
         
-        # 创建新场景数据
-        new_scene = SceneData(
-            scene_type=scene_type,
-            scene_id=scene_id,
-            params=params
-        )
+        if isinstance(scene_type, SceneData):
+            # 直接沿用已有的场景数据
+            new_scene = scene_type
+        else:
+            # 创建新场景数据
+            new_scene = SceneData(
+                scene_type,
+                scene_id,
+                params if params is not None else {}
+            )
         
         self._pending_scene = new_scene
         
         if show_loading:
             # 显示加载画面
-            tasks = loading_tasks or self._get_default_loading_tasks(scene_type)
+            tasks = loading_tasks or self._get_default_loading_tasks(new_scene.scene_type)
             self.loading_screen.start_loading(tasks)
             
             # 开始加载场景
@@ -361,24 +501,9 @@ class SceneManager:
     
     def _get_default_loading_tasks(self, scene_type: SceneType) -> List[LoadingTask]:
         """获取默认加载任务"""
-        if scene_type == SceneType.GAMEPLAY:
-            return [
-                LoadingTask("unload", "卸载当前场景...", weight=0.5),
-                LoadingTask("environment", "加载环境...", weight=2.0),
-                LoadingTask("titans", "生成巨人...", weight=1.5),
-                LoadingTask("player", "初始化玩家...", weight=1.0),
-                LoadingTask("ui", "准备界面...", weight=0.5)
-            ]
-        elif scene_type == SceneType.CUTSCENE:
-            return [
-                LoadingTask("unload", "准备过场动画...", weight=0.5),
-                LoadingTask("assets", "加载资源...", weight=1.0),
-                LoadingTask("dialogue", "加载对话...", weight=0.5)
-            ]
-        else:
-            return [
-                LoadingTask("init", "初始化...", weight=1.0)
-            ]
+        return _build_loading_tasks(
+            _DEFAULT_LOADING_TASKS.get(scene_type, _FALLBACK_LOADING_TASKS)
+        )
     
     def _start_scene_loading(self, scene: SceneData) -> None:
         """开始场景加载"""
@@ -394,12 +519,130 @@ class SceneManager:
             except Exception as e:
                 self.loading_screen.set_task_error("environment", str(e))
                 return
+        elif scene.scene_type in self._task_loaders:
+            # 按任务阶段分派, 由 update 在主线程中收集结果
+            if self.loading_screen.state == LoadingState.LOADING:
+                self._dispatch_task_loaders(scene, self._task_loaders[scene.scene_type])
         else:
             # 没有自定义加载器，直接完成所有任务
             for task in self.loading_screen._tasks:
                 if not task.completed:
                     self.loading_screen.complete_task(task.name)
     
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        """获取 I/O 线程池(首次使用时创建)"""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="scene-io")
+        return self._io_pool
+    
+    def _dispatch_task_loaders(
+        self,
+        scene: SceneData,
+        loaders: Dict[str, Callable[[SceneData], None]]
+    ) -> None:
+        """
+        分派各加载任务
+        
+        I/O 任务提交到线程池并行执行; 主线程任务排队,
+        由 update 逐帧执行, 加载期间主循环不会被阻塞
+        """
+        self._load_generation += 1
+        generation = self._load_generation
+        self._loading_scene = scene
+        self._main_thread_tasks = []
+        
+        for task in list(self.loading_screen._tasks):
+            if task.completed:
+                continue
+            loader = loaders.get(task.name)
+            if loader is None:
+                # 没有对应加载器的任务视为立即完成, 同样经由完成队列处理
+                self._completion_queue.put((generation, task.name, None))
+            elif task.stage == LoadingStage.MAIN:
+                self._main_thread_tasks.append((task.name, loader))
+            else:
+                self._get_io_pool().submit(
+                    self._run_task_loader, generation, task.name, loader, scene
+                )
+    
+    def _cancel_task_loading(self) -> None:
+        """放弃分派中的加载任务, 后台线程之后送达的结果将被忽略"""
+        if self._loading_scene is None:
+            return
+        self._load_generation += 1
+        self._loading_scene = None
+        self._main_thread_tasks = []
+    
+    def shutdown(self) -> None:
+        """
+        关闭场景管理器
+        
+        放弃进行中的分派加载并关闭 I/O 线程池, 不等待正在执行的加载器;
+        之后再次加载时会重新创建线程池
+        """
+        self._cancel_task_loading()
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=False)
+            self._io_pool = None
+    
+    def _run_task_loader(
+        self,
+        generation: int,
+        task_name: str,
+        loader: Callable[[SceneData], None],
+        scene: SceneData
+    ) -> None:
+        """在线程池中执行加载器, 结果放入完成队列"""
+        try:
+            loader(scene)
+        except Exception as e:
+            self._completion_queue.put((generation, task_name, str(e)))
+        else:
+            self._completion_queue.put((generation, task_name, None))
+    
+    def update(self) -> None:
+        """
+        处理分派中的加载任务（每帧调用）
+        
+        汇总后台任务的完成结果, 并执行一个排队的主线程任务;
+        没有分派中的任务时不做任何事
+        """
+        if self._loading_scene is None:
+            return
+        
+        generation = self._load_generation
+        while True:
+            try:
+                task_generation, task_name, error = self._completion_queue.get_nowait()
+            except queue.Empty:
+                break
+            if task_generation != generation or self._loading_scene is None:
+                # 已被新的场景切换取代的加载结果
+                continue
+            self._finish_task(task_name, error)
+        
+        if self._main_thread_tasks and self._loading_scene is not None:
+            task_name, loader = self._main_thread_tasks.pop(0)
+            try:
+                loader(self._loading_scene)
+            except Exception as e:
+                self._finish_task(task_name, str(e))
+            else:
+                self._finish_task(task_name, None)
+    
+    def _finish_task(self, task_name: str, error: Optional[str]) -> None:
+        """在主线程中记录任务结果"""
+        if error is not None:
+            self._cancel_task_loading()
+            self.loading_screen.set_task_error(task_name, error)
+            return
+        
+        if self.loading_screen.state != LoadingState.LOADING:
+            return
+        self.loading_screen.complete_task(task_name)
+        if self.loading_screen.state == LoadingState.COMPLETE or not self.loading_screen.visible:
+            self._loading_scene = None
+    
     def _unload_current_scene(self) -> None:
         """卸载当前场景"""
         if self._current_scene.scene_type in self._scene_unloaders:
@@ -426,7 +669,7 @@ class SceneManager:
             self._on_scene_change_callback(old_scene, new_scene)
         
         # 触发场景类型特定回调
-        for callback in self._scene_callbacks.get(new_scene.scene_type, []):
+        for callback in self._scene_callbacks[_SCENE_TYPE_INDEX[new_scene.scene_type]]:
             callback(new_scene)
         
         # 触发场景加载完成回调
@@ -529,12 +772,7 @@ class SceneManager:
             bool: 是否成功返回
         """
         if self._previous_scene:
-            self.change_scene(
-                self._previous_scene.scene_type,
-                self._previous_scene.scene_id,
-                self._previous_scene.params,
-                show_loading=False
-            )
+            self.change_scene(self._previous_scene, show_loading=False)
             return True
         return False
     
@@ -552,22 +790,51 @@ class SceneManager:
             scene_type: 场景类型
             callback: 回调函数
         """
-        if scene_type in self._scene_callbacks:
-            self._scene_callbacks[scene_type].append(callback)
+        if isinstance(scene_type, SceneType):
+            self._scene_callbacks[_SCENE_TYPE_INDEX[scene_type]].append(callback)
     
     def register_scene_loader(
         self,
         scene_type: SceneType,
-        loader: Callable[[SceneData, LoadingScreen], None]
+        loader: Union[
+            Callable[[SceneData, LoadingScreen], None],
+            List[Tuple[str, Callable[[SceneData], None]]]
+        ]
     ) -> None:
         """
         注册场景加载器
         
         Args:
             scene_type: 场景类型
-            loader: 加载器函数
+            loader: 加载器函数; 也可以是 (任务名, 加载器) 列表,
+                此时等同于逐个调用 register_task_loader, 各任务并行加载
+        """
+        if isinstance(loader, list):
+            self._scene_loaders.pop(scene_type, None)
+            for task_name, task_loader in loader:
+                self.register_task_loader(scene_type, task_name, task_loader)
+        else:
+            self._scene_loaders[scene_type] = loader
+    
+    def register_task_loader(
+        self,
+        scene_type: SceneType,
+        task_name: str,
+        loader: Callable[[SceneData], None]
+    ) -> None:
+        """
+        注册单个加载任务的加载器
+        
+        没有注册整体场景加载器时, 场景加载会按各任务的 stage 分派:
+        IO 阶段在后台线程池执行, MAIN 阶段在主线程的 update 中执行;
+        任务完成由 update 汇总, 因此需要每帧调用 update
+        
+        Args:
+            scene_type: 场景类型
+            task_name: 加载任务名称
+            loader: 加载器函数, 抛出异常表示加载失败
         """
-        self._scene_loaders[scene_type] = loader
+        self._task_loaders.setdefault(scene_type, {})[task_name] = loader
     
     def register_scene_unloader(
         self,
@@ -610,7 +877,7 @@ class SceneManager:
             'current_scene': self._current_scene.to_dict(),
             'previous_scene': self._previous_scene.to_dict() if self._previous_scene else None,
             'is_loading': self.is_loading,
-            'loading_progress': self.loading_screen.progress.to_dict() if self.is_loading else None
+            'loading_progress': self.loading_screen.get_progress_dict() if self.is_loading else None
         }
     
     def render(self) -> Dict[str, Any]:
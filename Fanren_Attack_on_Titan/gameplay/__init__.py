@@ -3,7 +3,7 @@
 """
 from .resource_system import ResourceSystem, ResourceState
 from .odm_system import ODMSystem, HookState, Vec3, Surface, HookSide
-from .combat_system import CombatSystem, AttackResult, TitanHitbox
+from .combat_system import CombatSystem, AttackResult, TitanHitbox, TitanSpatialHash
 from .combat_system import Vec3 as CombatVec3
 from .titan_ai import (
     TitanAI, TitanType, TitanState, TitanData, BehaviorPattern,
@@ -24,6 +24,7 @@ __all__ = [
     'CombatSystem',
     'AttackResult',
     'TitanHitbox',
+    'TitanSpatialHash',
     'CombatVec3',
     'TitanAI',
     'TitanType',
@@ -2,18 +2,25 @@
 战斗系统 - 管理攻击、伤害计算和连击系统
 """
 from dataclasses import dataclass, field
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, Dict, Iterable, List, Sequence, Set, Tuple, TYPE_CHECKING
 from enum import Enum
+import math
 import sys
 import os
 import time
 
-# 添加父目录到路径以便导入config
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import GAME_CONFIG
+# 添加父目录到路径以便导入config(已在路径中时不再重复插入)
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.insert(0, _ROOT_DIR)
+from config import GAME_CONFIG, DATACLASS_SLOTS
 
+# 命中部位名称(驻留字符串, 使用方可以用 is 比较)
+_PART_NAPE: str = sys.intern("nape")
+_PART_BODY: str = sys.intern("body")
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class Vec3:
     """简单的3D向量类"""
     x: float = 0.0
@@ -26,9 +33,16 @@ class Vec3:
         dy = self.y - other.y
         dz = self.z - other.z
         return (dx * dx + dy * dy + dz * dz) ** 0.5
+    
+    def distance_sq_to(self, other: 'Vec3') -> float:
+        """计算到另一个点的距离平方(与半径平方比较时无需开方)"""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        dz = self.z - other.z
+        return dx * dx + dy * dy + dz * dz
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AttackResult:
     """
     攻击结果数据类
@@ -52,6 +66,9 @@ class TitanHitbox:
     巨人碰撞箱（用于命中检测）
     
     简化模型：巨人由多个碰撞区域组成
+    
+    后颈绝对位置以标量形式缓存, 在重新赋值 position 或 nape_center 后
+    重新计算; 原地修改这两个向量的分量不会被察觉, 需重新赋值
     """
     def __init__(
         self,
@@ -69,26 +86,114 @@ class TitanHitbox:
             nape_radius: 后颈碰撞半径
             health: 巨人生命值
         """
-        self.position = position
-        self.nape_center = nape_center
-        self.nape_radius = nape_radius
+        # 位置向量; 经 update_position 移动后为 None, 由标量 _px/_py/_pz 表示,
+        # 读取 position 时才创建向量
+        self._position: Optional[Vec3] = position
+        self._px = self._py = self._pz = 0.0
+        self._nape_center = nape_center
+        self._abs_dirty = True  # 后颈绝对位置缓存是否需要重新计算
+        self._ax = self._ay = self._az = 0.0
+        self.nape_radius = nape_radius  # 同时更新 nape_radius_sq
         self.health = health
         self.max_health = health
         self.is_alive = True
     
+    @property
+    def position(self) -> Vec3:
+        """巨人位置"""
+        position = self._position
+        if position is None:
+            position = self._position = Vec3(self._px, self._py, self._pz)
+        return position
+    
+    @position.setter
+    def position(self, value: Vec3) -> None:
+        self._position = value
+        self._abs_dirty = True
+    
+    @property
+    def nape_center(self) -> Vec3:
+        """后颈中心位置（相对于巨人位置）"""
+        return self._nape_center
+    
+    @nape_center.setter
+    def nape_center(self, value: Vec3) -> None:
+        self._nape_center = value
+        self._abs_dirty = True
+    
+    @property
+    def nape_radius(self) -> float:
+        """后颈碰撞半径"""
+        return self._nape_radius
+    
+    @nape_radius.setter
+    def nape_radius(self, value: float) -> None:
+        self._nape_radius = value
+        # 半径平方, 命中判定直接与距离平方比较
+        self.nape_radius_sq = value * value
+    
+    def update_position(self, x: float, y: float, z: float) -> None:
+        """
+        移动巨人(供移动系统每帧调用)
+        
+        只写入标量并直接更新后颈绝对位置缓存, 不创建向量;
+        之后的命中判定无需再做加法
+        
+        Args:
+            x, y, z: 巨人新位置
+        """
+        self._position = None
+        self._px = x
+        self._py = y
+        self._pz = z
+        nape_center = self._nape_center
+        self._ax = x + nape_center.x
+        self._ay = y + nape_center.y
+        self._az = z + nape_center.z
+        self._abs_dirty = False
+    
+    def _update_absolute_nape(self) -> None:
+        """重新计算后颈绝对位置缓存"""
+        position = self._position
+        nape_center = self._nape_center
+        if position is None:
+            self._ax = self._px + nape_center.x
+            self._ay = self._py + nape_center.y
+            self._az = self._pz + nape_center.z
+        else:
+            self._ax = position.x + nape_center.x
+            self._ay = position.y + nape_center.y
+            self._az = position.z + nape_center.z
+        self._abs_dirty = False
+    
     def get_absolute_nape_position(self) -> Vec3:
         """获取后颈的绝对位置"""
-        return Vec3(
-            self.position.x + self.nape_center.x,
-            self.position.y + self.nape_center.y,
-            self.position.z + self.nape_center.z
-        )
+        if self._abs_dirty:
+            self._update_absolute_nape()
+        return Vec3(self._ax, self._ay, self._az)
+    
+    def get_absolute_nape_xyz(self) -> Tuple[float, float, float]:
+        """获取后颈的绝对位置分量(不创建向量)"""
+        if self._abs_dirty:
+            self._update_absolute_nape()
+        return self._ax, self._ay, self._az
+    
+    def nape_dist_sq(self, x: float, y: float, z: float) -> float:
+        """
+        计算点到后颈中心的距离平方
+        
+        使用缓存的后颈绝对位置, 以标量计算, 无需开方
+        """
+        if self._abs_dirty:
+            self._update_absolute_nape()
+        dx = x - self._ax
+        dy = y - self._ay
+        dz = z - self._az
+        return dx * dx + dy * dy + dz * dz
     
     def is_point_in_nape(self, point: Vec3) -> bool:
         """检查点是否在后颈碰撞区域内"""
-        nape_pos = self.get_absolute_nape_position()
-        distance = point.distance_to(nape_pos)
-        return distance <= self.nape_radius
+        return self.nape_dist_sq(point.x, point.y, point.z) <= self.nape_radius_sq
     
     def take_damage(self, damage: float, is_nape_hit: bool) -> bool:
         """
@@ -121,6 +226,137 @@ class TitanHitbox:
         return False
 
 
+class TitanSpatialHash:
+    """
+    巨人空间哈希网格
+    
+    按后颈碰撞球的包围盒将巨人分入均匀网格单元, 查询时只检查
+    查询范围覆盖的单元, 避免遍历所有巨人. 巨人移动后需重建网格
+    """
+    
+    def __init__(self, cell_size: float = 4.0):
+        """
+        初始化空间哈希网格
+        
+        Args:
+            cell_size: 单元边长, 建议不小于最大后颈碰撞直径
+        """
+        self.cell_size = cell_size
+        self._inv_cell_size = 1.0 / cell_size
+        self._cells: Dict[Tuple[int, int, int], List[TitanHitbox]] = {}
+        # 清空网格时回收的单元列表, 重建时复用以减少分配
+        self._free_lists: List[List[TitanHitbox]] = []
+        # 查询结果列表与去重集合, 每次查询时复用
+        self._query_result: List[TitanHitbox] = []
+        self._query_seen: Set[int] = set()
+        self._count: int = 0
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def clear(self) -> None:
+        """清空网格"""
+        free_lists = self._free_lists
+        for cell in self._cells.values():
+            cell.clear()
+            free_lists.append(cell)
+        self._cells.clear()
+        self._count = 0
+    
+    def insert(self, titan: TitanHitbox) -> None:
+        """
+        插入巨人
+        
+        Args:
+            titan: 巨人碰撞箱
+        """
+        ax, ay, az = titan.get_absolute_nape_xyz()
+        radius = titan.nape_radius
+        inv = self._inv_cell_size
+        min_x = math.floor((ax - radius) * inv)
+        max_x = math.floor((ax + radius) * inv)
+        min_y = math.floor((ay - radius) * inv)
+        max_y = math.floor((ay + radius) * inv)
+        min_z = math.floor((az - radius) * inv)
+        max_z = math.floor((az + radius) * inv)
+        
+        cells = self._cells
+        free_lists = self._free_lists
+        for ix in range(min_x, max_x + 1):
+            for iy in range(min_y, max_y + 1):
+                for iz in range(min_z, max_z + 1):
+                    key = (ix, iy, iz)
+                    cell = cells.get(key)
+                    if cell is None:
+                        cell = free_lists.pop() if free_lists else []
+                        cells[key] = cell
+                    cell.append(titan)
+        self._count += 1
+    
+    def rebuild(self, titans: Iterable[TitanHitbox]) -> None:
+        """
+        用给定巨人重建网格(每帧巨人移动后调用)
+        
+        Args:
+            titans: 巨人碰撞箱集合, 已死亡的巨人会被跳过
+        """
+        self.clear()
+        for titan in titans:
+            if titan is not None and titan.is_alive:
+                self.insert(titan)
+    
+    def query(self, point: Vec3, radius: float = 0.0) -> List[TitanHitbox]:
+        """
+        查询范围内可能相交的巨人
+        
+        返回以 point 为中心、radius 为半径的包围盒所覆盖单元内的巨人,
+        结果只是候选, 仍需精确判定. 返回的列表在下次查询时复用, 调用方不应保存
+        
+        Args:
+            point: 查询中心
+            radius: 查询半径
+            
+        Returns:
+            List[TitanHitbox]: 候选巨人列表(去重)
+        """
+        result = self._query_result
+        result.clear()
+        seen = self._query_seen
+        seen.clear()
+        
+        inv = self._inv_cell_size
+        px, py, pz = point.x, point.y, point.z
+        cells = self._cells
+        for ix in range(math.floor((px - radius) * inv), math.floor((px + radius) * inv) + 1):
+            for iy in range(math.floor((py - radius) * inv), math.floor((py + radius) * inv) + 1):
+                for iz in range(math.floor((pz - radius) * inv), math.floor((pz + radius) * inv) + 1):
+                    cell = cells.get((ix, iy, iz))
+                    if not cell:
+                        continue
+                    for titan in cell:
+                        titan_id = id(titan)
+                        if titan_id not in seen:
+                            seen.add(titan_id)
+                            result.append(titan)
+        return result
+
+
+def _build_kill_score_tables(
+    base_score: float,
+    combo_table: Tuple[float, ...],
+    style_multipliers: Tuple[float, ...]
+) -> Dict[float, Tuple[int, ...]]:
+    """
+    预先计算击杀分数表
+    
+    返回以风格倍率为键、以连击数为下标的击杀分数, 计算方式与
+    CombatSystem._calculate_kill_score 逐次计算的结果一致
+    """
+    return {
+        style: tuple(int(base_score * (combo * style)) for combo in combo_table)
+        for style in style_multipliers
+    }
+
 
 class CombatSystem:
     """
@@ -137,10 +373,42 @@ class CombatSystem:
         3.6 - 击杀巨人根据攻击风格和连击倍率奖励分数
     """
     
+    __slots__ = (
+        '_base_attack_damage',
+        '_durability_cost',
+        '_combo_timeout',
+        '_combo_timeout_ns',
+        '_max_blade_durability',
+        '_blade_durability',
+        '_combo_count',
+        '_last_kill_ns',
+        '_total_score',
+        '_attack_enabled',
+        '_current_style_multiplier',
+        '_damage_table',
+        '_style_table',
+        '_titan_grid',
+    )
+    
     # 分数常量
     BASE_KILL_SCORE: float = 100.0
     STYLE_MULTIPLIER_SPEED_THRESHOLD: float = 10.0  # 高速攻击阈值
     STYLE_MULTIPLIER_BONUS: float = 1.5  # 高速攻击额外倍率
+    NAPE_DAMAGE_FACTOR: float = 10.0  # 后颈命中伤害倍率（确保击杀）
+    BODY_DAMAGE_FACTOR: float = 0.3  # 非后颈命中伤害倍率
+    
+    # 连击倍率表(下标为连击数): 每次连击增加0.1倍率，最高3倍, 21连击起达到上限
+    _COMBO_MULT_TABLE: Tuple[float, ...] = tuple(
+        min(1.0 + (c - 1) * 0.1, 3.0) if c > 0 else 1.0 for c in range(32)
+    )
+    
+    # 击杀分数表 {风格倍率: (各连击数下的分数, ...)}
+    _KILL_SCORE_TABLES: Dict[float, Tuple[int, ...]] = _build_kill_score_tables(
+        BASE_KILL_SCORE, _COMBO_MULT_TABLE, (1.0, STYLE_MULTIPLIER_BONUS)
+    )
+    
+    # 未指定目标时, 命中点到后颈碰撞球表面的最大选取距离
+    BLADE_RANGE: float = 2.0
     
     def __init__(
         self,
@@ -162,17 +430,25 @@ class CombatSystem:
         self._base_attack_damage = base_attack_damage if base_attack_damage is not None else GAME_CONFIG.BASE_ATTACK_DAMAGE
         self._durability_cost = durability_cost if durability_cost is not None else GAME_CONFIG.DURABILITY_COST_PER_ATTACK
         self._combo_timeout = combo_timeout if combo_timeout is not None else GAME_CONFIG.COMBO_TIMEOUT
+        self._combo_timeout_ns: int = int(self._combo_timeout * 1e9)
         self._max_blade_durability = max_blade_durability if max_blade_durability is not None else GAME_CONFIG.MAX_BLADE_DURABILITY
         
         # 战斗状态
         self._blade_durability: float = self._max_blade_durability
         self._combo_count: int = 0
-        self._last_kill_time: float = 0.0
+        # 上次击杀的单调时钟时间(纳秒), None 表示尚无击杀
+        self._last_kill_ns: Optional[int] = None
         self._total_score: int = 0
         self._attack_enabled: bool = True
         
         # 风格倍率（基于攻击速度）
         self._current_style_multiplier: float = 1.0
+        
+        # 伤害查找表 [是否高速][是否后颈], 基础伤害不变时无需每次相乘
+        self._recompute_damage_table()
+        
+        # 巨人空间哈希网格, 用于在多个巨人中查找攻击目标
+        self._titan_grid: TitanSpatialHash = TitanSpatialHash()
     
     # ==================== 属性访问器 ====================
     
@@ -225,6 +501,85 @@ class CombatSystem:
             return False
         return titan.is_point_in_nape(hit_point)
     
+    def check_nape_hits_batch(
+        self,
+        titans: Sequence[TitanHitbox],
+        hit_points: Sequence[Vec3]
+    ) -> List[bool]:
+        """
+        批量检查后颈命中
+        
+        按顺序将每个巨人与对应的命中点配对判定, 比较距离平方,
+        在一次循环中完成, 免去逐个调用 check_nape_hit 的开销
+        
+        Args:
+            titans: 巨人碰撞箱列表
+            hit_points: 与巨人一一对应的攻击命中点列表
+            
+        Returns:
+            List[bool]: 每个巨人是否被命中后颈
+        """
+        results = []
+        append = results.append
+        for titan, point in zip(titans, hit_points):
+            if titan is None or point is None:
+                append(False)
+                continue
+            append(titan.nape_dist_sq(point.x, point.y, point.z) <= titan.nape_radius_sq)
+        return results
+    
+    def update_titan_grid(self, titans: Iterable[TitanHitbox]) -> None:
+        """
+        用当前巨人重建空间哈希网格(巨人移动后每帧调用)
+        
+        Args:
+            titans: 巨人碰撞箱集合
+        """
+        self._titan_grid.rebuild(titans)
+    
+    def find_target(self, hit_point: Vec3, blade_range: float) -> Optional[TitanHitbox]:
+        """
+        在空间哈希网格中查找攻击目标
+        
+        只检查命中点附近单元中的巨人, 返回后颈离命中点最近、
+        且命中点到后颈碰撞球表面不超过 blade_range 的存活巨人
+        网格内容以最近一次 update_titan_grid 为准
+        
+        Args:
+            hit_point: 攻击命中点
+            blade_range: 刀刃可触及的距离
+            
+        Returns:
+            Optional[TitanHitbox]: 目标巨人, 范围内没有巨人时为 None
+        """
+        if hit_point is None:
+            return None
+        
+        px, py, pz = hit_point.x, hit_point.y, hit_point.z
+        best = None
+        best_distance_sq = 0.0
+        for titan in self._titan_grid.query(hit_point, blade_range):
+            if not titan.is_alive:
+                continue
+            distance_sq = titan.nape_dist_sq(px, py, pz)
+            reach = titan.nape_radius + blade_range
+            if distance_sq <= reach * reach and (best is None or distance_sq < best_distance_sq):
+                best = titan
+                best_distance_sq = distance_sq
+        return best
+    
+    def _recompute_damage_table(self) -> None:
+        """根据基础伤害重新计算伤害查找表"""
+        nape_damage = self._base_attack_damage * self.NAPE_DAMAGE_FACTOR
+        body_damage = self._base_attack_damage * self.BODY_DAMAGE_FACTOR
+        bonus = self.STYLE_MULTIPLIER_BONUS
+        # 以比较结果(False/True 即 0/1)直接作为下标, 选择时无需分支
+        self._damage_table = (
+            (body_damage, nape_damage),
+            (body_damage * bonus, nape_damage * bonus)
+        )
+        self._style_table = (1.0, bonus)
+    
     def calculate_damage(self, is_nape: bool, speed: float = 0.0) -> float:
         """
         计算伤害值
@@ -238,30 +593,18 @@ class CombatSystem:
             
         Requirements: 3.1, 3.2 - 后颈暴击伤害 vs 普通伤害
         """
-        base_damage = self._base_attack_damage
-        
-        # 后颈命中造成致命伤害（实际上会直接击杀）
-        if is_nape:
-            # 后颈命中伤害 = 基础伤害 * 10（确保击杀）
-            damage = base_damage * 10.0
-        else:
-            # 非后颈命中造成减少伤害
-            damage = base_damage * 0.3
-        
-        # 速度加成
-        if speed > self.STYLE_MULTIPLIER_SPEED_THRESHOLD:
-            damage *= self.STYLE_MULTIPLIER_BONUS
-            self._current_style_multiplier = self.STYLE_MULTIPLIER_BONUS
-        else:
-            self._current_style_multiplier = 1.0
-        
-        return damage
+        # 后颈命中造成致命伤害（实际上会直接击杀）, 非后颈命中造成减少伤害;
+        # 高速攻击获得风格加成. 各组合的伤害已在查找表中算好
+        is_fast = speed > self.STYLE_MULTIPLIER_SPEED_THRESHOLD
+        self._current_style_multiplier = self._style_table[is_fast]
+        return self._damage_table[is_fast][bool(is_nape)]
     
     def perform_slash(
         self,
         titan: TitanHitbox,
         hit_point: Vec3,
-        attack_speed: float = 0.0
+        attack_speed: float = 0.0,
+        now_ns: Optional[int] = None
     ) -> AttackResult:
         """
         执行斩击攻击
@@ -270,6 +613,7 @@ class CombatSystem:
             titan: 目标巨人
             hit_point: 攻击命中点
             attack_speed: 攻击时的移动速度
+            now_ns: 本帧的单调时钟时间(纳秒), 用作击杀时间; 默认读取 time.monotonic_ns()
             
         Returns:
             AttackResult: 攻击结果
@@ -298,10 +642,10 @@ class CombatSystem:
         # 命中判定
         result.hit = True
         
-        # 检查后颈命中 (Requirement 3.1)
-        is_nape_hit = self.check_nape_hit(titan, hit_point)
+        # 检查后颈命中 (Requirement 3.1), 目标已确认非空, 直接判定
+        is_nape_hit = hit_point is not None and titan.is_point_in_nape(hit_point)
         result.is_critical = is_nape_hit
-        result.target_part = "nape" if is_nape_hit else "body"
+        result.target_part = _PART_NAPE if is_nape_hit else _PART_BODY
         
         # 计算伤害
         damage = self.calculate_damage(is_nape_hit, attack_speed)
@@ -313,46 +657,159 @@ class CombatSystem:
         
         # 如果击杀，更新连击和分数 (Requirement 3.3, 3.6)
         if killed:
-            self._update_combo_on_kill()
+            self._update_combo_on_kill(now_ns)
             score = self._calculate_kill_score()
             self._total_score += score
         
         return result
     
+    def perform_slash_nearest(
+        self,
+        hit_point: Vec3,
+        attack_speed: float = 0.0,
+        now_ns: Optional[int] = None
+    ) -> AttackResult:
+        """
+        对命中点附近的巨人执行斩击
+        
+        按 BLADE_RANGE 在空间哈希网格中查找目标(见 find_target), 本方法不重建网格;
+        移动系统应在巨人移动后每帧调用一次 update_titan_grid, 同一帧内的多次斩击
+        共用这份网格. 范围内没有巨人时视为未命中
+        
+        Args:
+            hit_point: 攻击命中点
+            attack_speed: 攻击时的移动速度
+            now_ns: 本帧的单调时钟时间(纳秒), 用作击杀时间; 默认读取 time.monotonic_ns()
+            
+        Returns:
+            AttackResult: 攻击结果
+        """
+        if not self.attack_enabled:
+            return AttackResult()
+        
+        titan = self.find_target(hit_point, self.BLADE_RANGE)
+        return self.perform_slash(titan, hit_point, attack_speed, now_ns)
+    
+    def perform_slash_sweep(
+        self,
+        titans: Sequence[TitanHitbox],
+        hit_points: Sequence[Vec3],
+        attack_speed: float = 0.0,
+        now_ns: Optional[int] = None
+    ) -> List[AttackResult]:
+        """
+        执行一次横扫斩击, 同时结算刀刃扫过的多个巨人
+        
+        一次横扫只消耗一次刀刃耐久度; 各巨人的命中、伤害与击杀
+        在同一循环中结算, 结果与逐个调用 perform_slash 的判定规则一致
+        
+        Args:
+            titans: 被扫中的巨人列表
+            hit_points: 与巨人一一对应的攻击命中点列表
+            attack_speed: 攻击时的移动速度
+            now_ns: 本帧的单调时钟时间(纳秒), 用作击杀时间; 默认读取 time.monotonic_ns()
+            
+        Returns:
+            List[AttackResult]: 与 titans 一一对应的攻击结果
+            
+        Raises:
+            ValueError: titans 与 hit_points 长度不一致
+        """
+        if len(titans) != len(hit_points):
+            raise ValueError(
+                f"titans and hit_points length mismatch: {len(titans)} != {len(hit_points)}"
+            )
+        results = [AttackResult() for _ in titans]
+        
+        # 检查攻击是否可用 (Requirement 3.5)
+        if not self.attack_enabled:
+            return results
+        
+        # 速度加成对整次横扫相同, 选定伤害查找表的一行
+        is_fast = attack_speed > self.STYLE_MULTIPLIER_SPEED_THRESHOLD
+        damage_row = self._damage_table[is_fast]
+        
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        
+        any_hit = False
+        for result, titan, point in zip(results, titans, hit_points):
+            if titan is None or not titan.is_alive:
+                continue
+            if not any_hit:
+                # 风格倍率只在横扫至少命中一个巨人时更新, 且须在结算击杀得分前写入
+                any_hit = True
+                self._current_style_multiplier = self._style_table[is_fast]
+            result.hit = True
+            
+            # 检查后颈命中 (Requirement 3.1)
+            is_nape_hit = point is not None and titan.is_point_in_nape(point)
+            result.is_critical = is_nape_hit
+            result.target_part = _PART_NAPE if is_nape_hit else _PART_BODY
+            damage = damage_row[is_nape_hit]
+            result.damage = damage
+            
+            killed = titan.take_damage(damage, is_nape_hit)
+            result.killed = killed
+            if killed:
+                self._update_combo_on_kill(now_ns)
+                self._total_score += self._calculate_kill_score()
+        
+        # 消耗刀刃耐久度 (Requirement 3.4)
+        if any_hit:
+            self._blade_durability -= self._durability_cost
+            if self._blade_durability < 0:
+                self._blade_durability = 0
+        
+        return results
+    
     # ==================== 连击系统 ====================
     
-    def _update_combo_on_kill(self) -> None:
-        """击杀时更新连击计数"""
-        current_time = time.time()
+    def _update_combo_on_kill(self, now_ns: Optional[int] = None) -> None:
+        """
+        击杀时更新连击计数
+        
+        Args:
+            now_ns: 击杀时的单调时钟时间(纳秒), 默认读取 time.monotonic_ns()
+        """
+        now = now_ns if now_ns is not None else time.monotonic_ns()
+        last = self._last_kill_ns
         
         # 检查是否在连击时间窗口内
-        if current_time - self._last_kill_time <= self._combo_timeout:
+        if last is not None and now - last <= self._combo_timeout_ns:
             self._combo_count += 1
         else:
             # 连击中断，重新开始
             self._combo_count = 1
         
-        self._last_kill_time = current_time
+        self._last_kill_ns = now
     
-    def update_combo(self, dt: float) -> None:
+    def update_combo(self, dt: float = 0.0, now_ns: Optional[int] = None) -> None:
         """
         更新连击状态（每帧调用）
         
+        游戏循环每帧读取一次 time.monotonic_ns() 并传给所有战斗系统,
+        可避免每个战斗系统各自读取时钟, 也便于回放时复现
+        
         Args:
             dt: 帧间隔时间
+            now_ns: 本帧的单调时钟时间(纳秒), 默认读取 time.monotonic_ns()
             
         Requirements: 3.3 - 连击计数追踪
         """
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        
         # 检查连击是否超时
         if self._combo_count > 0:
-            current_time = time.time()
-            if current_time - self._last_kill_time > self._combo_timeout:
+            last = self._last_kill_ns
+            if last is None or now_ns - last > self._combo_timeout_ns:
                 self._combo_count = 0
     
     def reset_combo(self) -> None:
         """重置连击计数"""
         self._combo_count = 0
-        self._last_kill_time = 0.0
+        self._last_kill_ns = None
     
     # ==================== 分数系统 ====================
     
@@ -367,13 +824,15 @@ class CombatSystem:
             
         Requirements: 3.6 - 基于攻击风格和连击倍率计算分数
         """
-        # 连击倍率：每次连击增加0.1倍率，最高3倍
-        combo_multiplier = min(1.0 + (self._combo_count - 1) * 0.1, 3.0) if self._combo_count > 0 else 1.0
-        
-        # 风格倍率
-        style_multiplier = self._current_style_multiplier
+        # 连击倍率：查表, 超出表长的连击数已处于3倍上限
+        combo_count = self._combo_count
+        table = self._COMBO_MULT_TABLE
+        if combo_count < len(table):
+            combo_multiplier = table[combo_count] if combo_count > 0 else 1.0
+        else:
+            combo_multiplier = table[-1]
         
-        return combo_multiplier * style_multiplier
+        return combo_multiplier * self._current_style_multiplier
     
     def _calculate_kill_score(self) -> int:
         """
@@ -382,6 +841,12 @@ class CombatSystem:
         Returns:
             int: 击杀获得的分数
         """
+        # 常见情况直接查表, 表外的连击数或风格倍率按公式计算
+        scores = self._KILL_SCORE_TABLES.get(self._current_style_multiplier)
+        combo_count = self._combo_count
+        if scores is not None and 0 <= combo_count < len(scores):
+            return scores[combo_count]
+        
         multiplier = self.get_score_multiplier()
         score = int(self.BASE_KILL_SCORE * multiplier)
         return score
@@ -435,7 +900,7 @@ class CombatSystem:
         """重置战斗系统到初始状态"""
         self._blade_durability = self._max_blade_durability
         self._combo_count = 0
-        self._last_kill_time = 0.0
+        self._last_kill_ns = None
         self._total_score = 0
         self._current_style_multiplier = 1.0
     
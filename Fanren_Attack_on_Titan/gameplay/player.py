@@ -11,11 +11,13 @@ Requirements:
     7.5 - 玩家死亡显示游戏结束
 """
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List, Callable, TYPE_CHECKING
+from typing import Optional, Dict, Any, List, Tuple, Callable, TYPE_CHECKING
 from enum import Enum
 import sys
 import os
 import math
+import random
+import time
 
 # 添加父目录到路径以便导入
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -27,6 +29,11 @@ from gameplay.combat_system import CombatSystem, AttackResult, TitanHitbox
 from gameplay.resource_system import ResourceSystem
 
 
+# QTE按键随机数生成器(模块级共享, 避免每次被抓取时重复导入)
+_RNG = random.Random()
+_QTE_KEYS: Tuple[str, ...] = ('space', 'e', 'q')
+
+
 class PlayerState(Enum):
     """玩家状态枚举"""
     IDLE = "idle"
@@ -97,10 +104,14 @@ class Player:
     BASE_HEALTH: float = 100.0
     GRAVITY: float = 9.8
     GROUND_Y: float = 0.0
+    # 判定为移动状态的最小速度(平方), 与速度的平方比较, 无需开方
+    MOVING_SPEED_SQ: float = 0.1 * 0.1
+    # 空中方向控制的速度系数
+    AIR_CONTROL: float = 0.3
     
     # QTE设置
     QTE_TIME_LIMIT: float = 2.0
-    QTE_KEYS: List[str] = ['space', 'e', 'q']
+    QTE_KEYS: Tuple[str, ...] = _QTE_KEYS
     
     def __init__(
         self,
@@ -118,7 +129,8 @@ class Player:
         self._character: Optional[Character] = character
         
         # 位置和运动
-        self._position: Vec3 = position if position else Vec3(0, 0, 0)
+        # 位置向量由玩家持有并逐帧原地更新, 传入的向量会被复制, 避免修改调用方的对象
+        self._position: Vec3 = Vec3(position.x, position.y, position.z) if position else Vec3(0, 0, 0)
         self._velocity: Vec3 = Vec3(0, 0, 0)
         self._rotation: float = 0.0  # Y轴旋转角度
         
@@ -201,9 +213,9 @@ class Player:
     
     @position.setter
     def position(self, value: Vec3) -> None:
-        """设置位置"""
-        self._position = value
-        self._odm_system.position = value
+        """设置位置(复制传入的向量)"""
+        self._position = Vec3(value.x, value.y, value.z)
+        self._odm_system.position = self._position
     
     @property
     def velocity(self) -> Vec3:
@@ -302,29 +314,28 @@ class Player:
             direction: 移动方向（归一化）
             dt: 时间步长
         """
-        if not self._is_alive or self._current_state == PlayerState.GRABBED:
+        if not self._is_alive or self._current_state is PlayerState.GRABBED:
             return
         
-        # 计算移动速度
+        # 计算移动速度(每次读取角色当前属性, 属性修改后立即生效)
         speed = self.BASE_MOVE_SPEED
         if self._character:
             speed *= self._character.stats.speed
         
-        # 应用移动
-        move_velocity = direction * speed
-        
+        # 应用移动(直接写入速度分量, 不创建中间向量)
+        velocity = self._velocity
         if self._is_grounded:
-            self._velocity.x = move_velocity.x
-            self._velocity.z = move_velocity.z
+            velocity.x = direction.x * speed
+            velocity.z = direction.z * speed
             if direction.magnitude() > 0.1:
                 self._current_state = PlayerState.MOVING
             else:
                 self._current_state = PlayerState.IDLE
         else:
             # 空中控制（减弱）
-            air_control = 0.3
-            self._velocity.x += move_velocity.x * air_control * dt
-            self._velocity.z += move_velocity.z * air_control * dt
+            air_speed = speed * self.AIR_CONTROL * dt
+            velocity.x += direction.x * air_speed
+            velocity.z += direction.z * air_speed
     
     def jump(self) -> bool:
         """
@@ -336,7 +347,7 @@ class Player:
         if not self._is_alive or not self._is_grounded:
             return False
         
-        if self._current_state == PlayerState.GRABBED:
+        if self._current_state is PlayerState.GRABBED:
             return False
         
         jump_force = 8.0
@@ -358,7 +369,7 @@ class Player:
         Returns:
             bool: 是否成功附着
         """
-        if not self._is_alive or self._current_state == PlayerState.GRABBED:
+        if not self._is_alive or self._current_state is PlayerState.GRABBED:
             return False
         
         success = self._odm_system.fire_hook(direction, side)
@@ -398,7 +409,7 @@ class Player:
         Returns:
             bool: 是否成功激活
         """
-        if not self._is_alive or self._current_state == PlayerState.GRABBED:
+        if not self._is_alive or self._current_state is PlayerState.GRABBED:
             return False
         
         # 检查资源系统的气体
@@ -418,20 +429,26 @@ class Player:
     
     def _get_boost_direction(self) -> Vec3:
         """获取推进方向"""
-        # 优先使用钩锁方向
-        if self._odm_system.left_hook.is_attached:
-            direction = self._odm_system.left_hook.attach_point - self._position
-            if direction.magnitude() > 0.001:
-                return direction.normalized()
-        
-        if self._odm_system.right_hook.is_attached:
-            direction = self._odm_system.right_hook.attach_point - self._position
-            if direction.magnitude() > 0.001:
-                return direction.normalized()
+        # 优先使用钩锁方向(先用长度平方判断非零, 只在归一化时开方一次)
+        position = self._position
+        odm = self._odm_system
+        for hook in (odm.left_hook, odm.right_hook):
+            if hook.is_attached:
+                point = hook.attach_point
+                dx = point.x - position.x
+                dy = point.y - position.y
+                dz = point.z - position.z
+                mag_sq = dx * dx + dy * dy + dz * dz
+                if mag_sq > 1e-6:
+                    mag = math.sqrt(mag_sq)
+                    return Vec3(dx / mag, dy / mag, dz / mag)
         
         # 使用当前速度方向
-        if self._velocity.magnitude() > 0.001:
-            return self._velocity.normalized()
+        velocity = self._velocity
+        mag_sq = velocity.x * velocity.x + velocity.y * velocity.y + velocity.z * velocity.z
+        if mag_sq > 1e-6:
+            mag = math.sqrt(mag_sq)
+            return Vec3(velocity.x / mag, velocity.y / mag, velocity.z / mag)
         
         # 默认向前
         return Vec3(0, 0, 1)
@@ -442,13 +459,19 @@ class Player:
     
     # ==================== 战斗控制 ====================
 
-    def attack(self, target: TitanHitbox, hit_point: Vec3) -> AttackResult:
+    def attack(
+        self,
+        target: TitanHitbox,
+        hit_point: Vec3,
+        now_ns: Optional[int] = None
+    ) -> AttackResult:
         """
         执行攻击
         
         Args:
             target: 目标巨人
             hit_point: 攻击命中点
+            now_ns: 本帧的单调时钟时间(纳秒), 用于连击计时; 默认读取时钟
             
         Returns:
             AttackResult: 攻击结果
@@ -457,7 +480,7 @@ class Player:
             3.1 - 后颈攻击击杀巨人
             3.4 - 攻击消耗刀刃耐久
         """
-        if not self._is_alive or self._current_state == PlayerState.GRABBED:
+        if not self._is_alive or self._current_state is PlayerState.GRABBED:
             return AttackResult()
         
         # 检查刀刃耐久度
@@ -466,7 +489,7 @@ class Player:
         
         # 执行攻击
         attack_speed = self._velocity.magnitude()
-        result = self._combat_system.perform_slash(target, hit_point, attack_speed)
+        result = self._combat_system.perform_slash(target, hit_point, attack_speed, now_ns=now_ns)
         
         # 同步刀刃耐久度到资源系统
         if result.hit:
@@ -570,8 +593,8 @@ class Player:
         self._is_grounded = True
         
         if position:
-            self._position = position
-            self._odm_system.position = position
+            self._position = Vec3(position.x, position.y, position.z)
+            self._odm_system.position = self._position
         
         self._velocity = Vec3(0, 0, 0)
         self._current_qte = None
@@ -599,8 +622,8 @@ class Player:
         self._odm_system.release_all_hooks()
         
         # 创建QTE事件
-        import random
-        required_key = random.choice(self.QTE_KEYS)
+        qte_keys = self.QTE_KEYS
+        required_key = qte_keys[_RNG.randrange(len(qte_keys))]
         self._current_qte = QTEEvent(
             required_key=required_key,
             time_limit=self.QTE_TIME_LIMIT
@@ -668,12 +691,13 @@ class Player:
     
     # ==================== 更新循环 ====================
     
-    def update(self, dt: float) -> None:
+    def update(self, dt: float, now_ns: Optional[int] = None) -> None:
         """
         每帧更新
         
         Args:
             dt: 时间步长
+            now_ns: 本帧的单调时钟时间(纳秒), 默认在此读取一次 time.monotonic_ns()
         """
         if not self._is_alive:
             return
@@ -685,28 +709,36 @@ class Player:
                 self._fail_qte()
             return  # 被抓取时不更新其他逻辑
         
-        # 更新ODM物理
-        if self._odm_system.is_any_hook_attached():
+        # 更新ODM物理(物理更新不会释放钩锁, 本帧的摆荡状态只需判断一次)
+        swinging = self._odm_system.is_any_hook_attached()
+        if swinging:
             self._odm_system.velocity = self._velocity
             self._odm_system.update_swing_physics(dt)
             self._velocity = self._odm_system.velocity
             self._position = self._odm_system.position
         else:
+            velocity = self._velocity
+            
             # 应用重力
             if not self._is_grounded:
-                self._velocity.y -= self.GRAVITY * dt
+                velocity.y -= self.GRAVITY * dt
             
-            # 更新位置
-            self._position = self._position + self._velocity * dt
+            # 原地更新位置, 每帧不创建新向量
+            position = self._position
+            position.x += velocity.x * dt
+            position.y += velocity.y * dt
+            position.z += velocity.z * dt
         
         # 地面检测
         self._check_ground()
         
-        # 更新战斗系统（连击计时）
-        self._combat_system.update_combo(dt)
+        # 更新战斗系统（连击计时）, 每帧只读取一次时钟
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        self._combat_system.update_combo(dt, now_ns)
         
         # 更新状态
-        self._update_state()
+        self._update_state(swinging)
     
     def _check_ground(self) -> None:
         """检测地面碰撞"""
@@ -716,27 +748,34 @@ class Player:
             self._is_grounded = True
             
             # 着陆时更新状态
-            if self._current_state == PlayerState.AIRBORNE:
-                if self._velocity.magnitude() > 0.1:
+            if self._current_state is PlayerState.AIRBORNE:
+                velocity = self._velocity
+                if velocity.x * velocity.x + velocity.y * velocity.y + velocity.z * velocity.z > self.MOVING_SPEED_SQ:
                     self._current_state = PlayerState.MOVING
                 else:
                     self._current_state = PlayerState.IDLE
         else:
             self._is_grounded = False
     
-    def _update_state(self) -> None:
-        """更新玩家状态"""
-        if self._current_state == PlayerState.DEAD:
+    def _update_state(self, swinging: bool) -> None:
+        """
+        更新玩家状态
+        
+        Args:
+            swinging: 是否有钩锁附着
+        """
+        if self._current_state is PlayerState.DEAD:
             return
         
-        if self._current_state == PlayerState.GRABBED:
+        if self._current_state is PlayerState.GRABBED:
             return
         
-        if self._odm_system.is_any_hook_attached():
+        velocity = self._velocity
+        if swinging:
             self._current_state = PlayerState.SWINGING
         elif not self._is_grounded:
             self._current_state = PlayerState.AIRBORNE
-        elif self._velocity.magnitude() > 0.1:
+        elif velocity.x * velocity.x + velocity.y * velocity.y + velocity.z * velocity.z > self.MOVING_SPEED_SQ:
             self._current_state = PlayerState.MOVING
         else:
             self._current_state = PlayerState.IDLE
@@ -796,7 +835,7 @@ class Player:
         return {
             'center': attack_center,
             'radius': 2.0,
-            'active': self._current_state == PlayerState.ATTACKING
+            'active': self._current_state is PlayerState.ATTACKING
         }
     
     # ==================== 回调设置 ====================
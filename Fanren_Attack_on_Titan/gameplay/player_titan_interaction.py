@@ -118,7 +118,7 @@ class PlayerTitanInteraction:
         if not self._player.is_alive:
             return results
         
-        if self._player.current_state == PlayerState.GRABBED:
+        if self._player.current_state is PlayerState.GRABBED:
             return results
         
         # 检查刀刃耐久度
@@ -229,13 +229,14 @@ class PlayerTitanInteraction:
         # 计算命中点
         # 检查是否能命中后颈
         nape_pos = titan.nape_position
-        nape_distance = math.sqrt(
-            (nape_pos.x - player_pos.x) ** 2 +
-            (nape_pos.y - player_pos.y) ** 2 +
-            (nape_pos.z - player_pos.z) ** 2
-        )
-        
-        if nape_distance <= self.ATTACK_RANGE + self.NAPE_HIT_BONUS_RANGE:
+        # 仅用于与范围比较, 使用距离平方避免开方
+        ndx = nape_pos.x - player_pos.x
+        ndy = nape_pos.y - player_pos.y
+        ndz = nape_pos.z - player_pos.z
+        nape_distance_sq = ndx * ndx + ndy * ndy + ndz * ndz
+        
+        nape_reach = self.ATTACK_RANGE + self.NAPE_HIT_BONUS_RANGE
+        if nape_distance_sq <= nape_reach * nape_reach:
             # 命中后颈
             hit_point = nape_pos
         else:
@@ -249,7 +250,7 @@ class PlayerTitanInteraction:
         return {
             'hit_point': hit_point,
             'distance': distance,
-            'is_nape_hit': nape_distance <= titan.nape_radius + self.NAPE_HIT_BONUS_RANGE
+            'is_nape_hit': nape_distance_sq <= (titan.nape_radius + self.NAPE_HIT_BONUS_RANGE) ** 2
         }
     
     def _create_titan_hitbox(self, titan: TitanAI) -> TitanHitbox:
@@ -293,7 +294,7 @@ class PlayerTitanInteraction:
         if not self._player.is_alive:
             return results
         
-        if self._player.current_state == PlayerState.GRABBED:
+        if self._player.current_state is PlayerState.GRABBED:
             return results
         
         player_pos = self._player.position
@@ -14,6 +14,7 @@ from .visual_effects import (
     SpeedLineEffect,
     MotionBlurEffect,
     SteamDissolutionEffect,
+    SteamParticleSystem,
     SlashTrailEffect,
     EffectType,
     SpeedLineConfig,
@@ -40,6 +41,7 @@ __all__ = [
     'SpeedLineEffect',
     'MotionBlurEffect',
     'SteamDissolutionEffect',
+    'SteamParticleSystem',
     'SlashTrailEffect',
     'EffectType',
     'SpeedLineConfig',
@@ -4,6 +4,8 @@
 Requirements: 9.1, 9.2, 9.3, 9.4
 """
 import os
+import json
+import struct
 import logging
 from enum import Enum
 from dataclasses import dataclass, field
@@ -16,6 +18,24 @@ from config import PATH_CONFIG
 logger = logging.getLogger(__name__)
 
 
+def _stdlib_json_dumps(obj: Any) -> bytes:
+    """标准库 json 序列化为紧凑的 UTF-8 字节串（与 orjson.dumps 的输出形式一致）"""
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+# orjson 为可选依赖，不可用时退回标准库 json
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = _stdlib_json_dumps
+
+# 音量配置的二进制存档格式: 主音量/音效/音乐/语音 四个小端双精度浮点数
+_VOLUME_STRUCT = struct.Struct('<4d')
+
+
 class SoundCategory(Enum):
     """音效类别"""
     ODM = "odm"           # 立体机动装置音效
@@ -711,6 +731,56 @@ class AudioSystem:
             self.config.voice_volume = config_dict['voice_volume']
         self._update_all_volumes()
     
+    def save_config_bytes(self) -> bytes:
+        """
+        将配置序列化为JSON字节串（用于存档）
+        
+        优先使用 orjson，不可用时退回标准库 json。
+        
+        Returns:
+            bytes: UTF-8编码的JSON数据
+        """
+        return _json_dumps(self.get_config_dict())
+    
+    def load_config_bytes(self, data: bytes) -> None:
+        """
+        从JSON字节串加载配置（用于读档）
+        
+        Args:
+            data: save_config_bytes 生成的数据
+        """
+        self.load_config_dict(_json_loads(data))
+    
+    def pack_config(self) -> bytes:
+        """
+        将音量配置打包为定长二进制数据（用于存档）
+        
+        Returns:
+            bytes: 32字节的音量数据
+        """
+        return _VOLUME_STRUCT.pack(
+            self.config.master_volume,
+            self.config.sfx_volume,
+            self.config.music_volume,
+            self.config.voice_volume
+        )
+    
+    def unpack_config(self, data: bytes) -> None:
+        """
+        从 pack_config 生成的二进制数据加载音量配置（用于读档）
+        
+        Args:
+            data: 二进制音量数据
+            
+        Raises:
+            struct.error: 数据长度不正确
+        """
+        (self.config.master_volume,
+         self.config.sfx_volume,
+         self.config.music_volume,
+         self.config.voice_volume) = _VOLUME_STRUCT.unpack(data)
+        self._update_all_volumes()
+    
     # ==================== 清理 ====================
     
     def cleanup(self) -> None:
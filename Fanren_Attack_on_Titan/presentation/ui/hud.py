@@ -20,6 +20,14 @@ class WarningType(Enum):
     CRITICAL_HEALTH = "critical_health"
 
 
+# 警告类型对应的显示文本
+WARNING_TEXTS: Dict[WarningType, str] = {
+    WarningType.LOW_GAS: "⚠ 气体不足!",
+    WarningType.LOW_BLADE: "⚠ 刀刃不足!",
+    WarningType.CRITICAL_HEALTH: "⚠ 生命危险!"
+}
+
+
 @dataclass
 class HUDData:
     """
@@ -177,15 +185,42 @@ class CounterDisplay(HUDElement):
         self.label = label
         self.font_size = font_size
         self.color = color
-        self.value: int = 0
-        self.max_value: Optional[int] = None
+        self._value: int = 0
+        self._max_value: Optional[int] = None
         self.warning_active = False
         self.warning_color = "#FF0000"
+        self._display_text = f"{label}: 0"
+    
+    @property
+    def value(self) -> int:
+        """当前值"""
+        return self._value
+    
+    @value.setter
+    def value(self, value: int) -> None:
+        """设置当前值（同步刷新显示文本）"""
+        self.set_value(value, self._max_value)
+    
+    @property
+    def max_value(self) -> Optional[int]:
+        """最大值，为 None 时不显示"""
+        return self._max_value
+    
+    @max_value.setter
+    def max_value(self, max_value: Optional[int]) -> None:
+        """设置最大值（同步刷新显示文本）"""
+        self.set_value(self._value, max_value)
     
     def set_value(self, value: int, max_value: Optional[int] = None) -> None:
-        """设置显示值"""
-        self.value = value
-        self.max_value = max_value
+        """设置显示值（数值变化时才重建显示文本）"""
+        if value == self._value and max_value == self._max_value:
+            return
+        self._value = value
+        self._max_value = max_value
+        if max_value is not None:
+            self._display_text = f"{self.label}: {value}/{max_value}"
+        else:
+            self._display_text = f"{self.label}: {value}"
     
     def set_warning(self, active: bool) -> None:
         """设置警告状态"""
@@ -193,9 +228,7 @@ class CounterDisplay(HUDElement):
     
     def get_display_text(self) -> str:
         """获取显示文本"""
-        if self.max_value is not None:
-            return f"{self.label}: {self.value}/{self.max_value}"
-        return f"{self.label}: {self.value}"
+        return self._display_text
     
     def render(self) -> Dict[str, Any]:
         """渲染计数器"""
@@ -203,11 +236,11 @@ class CounterDisplay(HUDElement):
         base.update({
             'type': 'counter',
             'label': self.label,
-            'value': self.value,
-            'max_value': self.max_value,
+            'value': self._value,
+            'max_value': self._max_value,
             'font_size': self.font_size,
             'color': self.warning_color if self.warning_active else self.color,
-            'display_text': self.get_display_text(),
+            'display_text': self._display_text,
             'warning_active': self.warning_active
         })
         return base
@@ -228,13 +261,26 @@ class ComboDisplay(HUDElement):
     ):
         super().__init__(x, y)
         self.font_size = font_size
-        self.combo_count = 0
+        self._combo_count = 0
         self.show_animation = False
         self.animation_scale = 1.0
+        self._display_text = ""
+    
+    @property
+    def combo_count(self) -> int:
+        """当前连击数"""
+        return self._combo_count
+    
+    @combo_count.setter
+    def combo_count(self, count: int) -> None:
+        """直接设置连击数（只刷新显示文本，不触发动画和可见性变化）"""
+        if count != self._combo_count:
+            self._display_text = f"COMBO x{count}" if count > 0 else ""
+            self._combo_count = count
     
     def set_combo(self, count: int) -> None:
         """设置连击数"""
-        if count > self.combo_count:
+        if count > self._combo_count:
             self.show_animation = True
             self.animation_scale = 1.5
         self.combo_count = count
@@ -255,9 +301,9 @@ class ComboDisplay(HUDElement):
         base = super().render()
         base.update({
             'type': 'combo',
-            'combo_count': self.combo_count,
+            'combo_count': self._combo_count,
             'font_size': self.font_size * self.animation_scale,
-            'display_text': f"COMBO x{self.combo_count}" if self.combo_count > 0 else "",
+            'display_text': self._display_text,
             'animation_active': self.show_animation
         })
         return base
@@ -284,46 +330,48 @@ class WarningIndicator(HUDElement):
         super().__init__(x, y, visible=False)
         self.warning_type = warning_type
         self.color = color
+        # 渲染时直接使用的缓存值，避免每帧访问 Enum.value 与查表
+        self._warning_type_value = warning_type.value
+        self._warning_text = WARNING_TEXTS.get(warning_type, "⚠ 警告!")
         self.blink_timer = 0.0
         self.blink_interval = 0.5
         self.is_blinking = False
     
     def activate(self) -> None:
-        """激活警告"""
+        """激活警告（已激活时不重复写入状态，避免打断闪烁节奏）"""
+        if self.is_blinking:
+            return
         self.visible = True
         self.is_blinking = True
     
     def deactivate(self) -> None:
         """停用警告"""
+        if not self.is_blinking and not self.visible:
+            return
         self.visible = False
         self.is_blinking = False
         self.blink_timer = 0.0
     
     def update_blink(self, dt: float) -> None:
-        """更新闪烁效果"""
+        """更新闪烁效果（扣除整段间隔而非清零，避免节奏随帧时间漂移）"""
         if self.is_blinking:
             self.blink_timer += dt
             if self.blink_timer >= self.blink_interval:
-                self.blink_timer = 0.0
+                self.blink_timer -= self.blink_interval
                 self.visible = not self.visible
     
     def get_warning_text(self) -> str:
         """获取警告文本"""
-        texts = {
-            WarningType.LOW_GAS: "⚠ 气体不足!",
-            WarningType.LOW_BLADE: "⚠ 刀刃不足!",
-            WarningType.CRITICAL_HEALTH: "⚠ 生命危险!"
-        }
-        return texts.get(self.warning_type, "⚠ 警告!")
+        return self._warning_text
     
     def render(self) -> Dict[str, Any]:
         """渲染警告指示器"""
         base = super().render()
         base.update({
             'type': 'warning',
-            'warning_type': self.warning_type.value,
+            'warning_type': self._warning_type_value,
             'color': self.color,
-            'text': self.get_warning_text(),
+            'text': self._warning_text,
             'is_blinking': self.is_blinking
         })
         return base
@@ -342,20 +390,34 @@ class ScoreDisplay(HUDElement):
     ):
         super().__init__(x, y)
         self.font_size = font_size
-        self.score = 0
+        self._score = 0
+        self._display_text = "SCORE: 0"
+    
+    @property
+    def score(self) -> int:
+        """当前分数"""
+        return self._score
+    
+    @score.setter
+    def score(self, score: int) -> None:
+        """设置分数（同步刷新显示文本）"""
+        self.set_score(score)
     
     def set_score(self, score: int) -> None:
         """设置分数"""
-        self.score = score
+        if score == self._score:
+            return
+        self._score = score
+        self._display_text = f"SCORE: {score:,}"
     
     def render(self) -> Dict[str, Any]:
         """渲染分数显示"""
         base = super().render()
         base.update({
             'type': 'score',
-            'score': self.score,
+            'score': self._score,
             'font_size': self.font_size,
-            'display_text': f"SCORE: {self.score:,}"
+            'display_text': self._display_text
         })
         return base
 
@@ -435,11 +497,24 @@ class HUD:
             color="#FF0000"
         )
         
+        # 需要每帧推进闪烁计时的警告指示器
+        self._warning_indicators = (
+            self.gas_warning,
+            self.blade_warning,
+            self.health_warning
+        )
+        
         # 可见性
         self._visible = True
         
         # 当前数据
         self._current_data = HUDData()
+        
+        # 基于当前数据生成的显示文本缓存，数据更新时清空
+        self._display_texts: Dict[str, str] = {}
+        
+        # 绑定到上述元素实例的数据写入函数
+        self._apply_data = self._build_apply_data()
     
     @property
     def visible(self) -> bool:
@@ -491,41 +566,65 @@ class HUD:
             data: HUD数据
         """
         self._current_data = data
+        self._display_texts.clear()
+        self._apply_data(data)
+    
+    def _build_apply_data(self) -> Callable[[HUDData], None]:
+        """
+        构建把HUD数据写入各元素的专用函数
         
-        # 更新资源条
-        self.gas_bar.set_fill(data.gas_percentage)
-        self.gas_bar.set_warning(data.low_gas_warning)
-        
-        self.blade_durability_bar.set_fill(data.blade_durability_percentage)
-        
-        self.health_bar.set_fill(data.health_percentage)
-        
-        # 更新计数器
-        self.blade_counter.set_value(data.blade_count, data.max_blades)
-        self.blade_counter.set_warning(data.low_blade_warning)
-        
-        # 更新连击显示
-        self.combo_display.set_combo(data.combo_count)
-        
-        # 更新分数
-        self.score_display.set_score(data.total_score)
-        
-        # 更新警告指示器 (Requirement 4.2, 4.3)
-        if data.low_gas_warning:
-            self.gas_warning.activate()
-        else:
-            self.gas_warning.deactivate()
-        
-        if data.low_blade_warning:
-            self.blade_warning.activate()
-        else:
-            self.blade_warning.deactivate()
+        各元素的绑定方法在构建时解析一次并由闭包持有，
+        每次更新不再重复查找 self.xxx 属性。
         
-        # 低生命值警告 (< 25%)
-        if data.health_percentage < 0.25:
-            self.health_warning.activate()
-        else:
-            self.health_warning.deactivate()
+        Returns:
+            Callable: 接收 HUDData 的更新函数
+        """
+        gas_set_fill = self.gas_bar.set_fill
+        gas_set_warning = self.gas_bar.set_warning
+        blade_durability_set_fill = self.blade_durability_bar.set_fill
+        health_set_fill = self.health_bar.set_fill
+        blade_counter_set_value = self.blade_counter.set_value
+        blade_counter_set_warning = self.blade_counter.set_warning
+        set_combo = self.combo_display.set_combo
+        set_score = self.score_display.set_score
+        gas_warning = self.gas_warning
+        blade_warning = self.blade_warning
+        health_warning = self.health_warning
+        
+        def apply_data(data: HUDData) -> None:
+            # 更新资源条
+            gas_set_fill(data.gas_percentage)
+            gas_set_warning(data.low_gas_warning)
+            blade_durability_set_fill(data.blade_durability_percentage)
+            health_percentage = data.health_percentage
+            health_set_fill(health_percentage)
+            
+            # 更新计数器
+            blade_counter_set_value(data.blade_count, data.max_blades)
+            blade_counter_set_warning(data.low_blade_warning)
+            
+            # 更新连击显示与分数
+            set_combo(data.combo_count)
+            set_score(data.total_score)
+            
+            # 更新警告指示器 (Requirement 4.2, 4.3)
+            if data.low_gas_warning:
+                gas_warning.activate()
+            else:
+                gas_warning.deactivate()
+            
+            if data.low_blade_warning:
+                blade_warning.activate()
+            else:
+                blade_warning.deactivate()
+            
+            # 低生命值警告 (< 25%)
+            if health_percentage < 0.25:
+                health_warning.activate()
+            else:
+                health_warning.deactivate()
+        
+        return apply_data
     
     def update_animations(self, dt: float) -> None:
         """
@@ -534,10 +633,25 @@ class HUD:
         Args:
             dt: 时间步长
         """
-        self.combo_display.update_animation(dt)
-        self.gas_warning.update_blink(dt)
-        self.blade_warning.update_blink(dt)
-        self.health_warning.update_blink(dt)
+        self._animation_tick(dt)
+    
+    def _animation_tick(self, dt: float) -> None:
+        """
+        单次遍历推进所有动画状态
+        
+        动画规则由各元素的 update_animation / update_blink 实现，
+        这里只为处于激活状态的元素分派，未激活的元素直接跳过。
+        
+        Args:
+            dt: 时间步长
+        """
+        combo = self.combo_display
+        if combo.show_animation:
+            combo.update_animation(dt)
+        
+        for warning in self._warning_indicators:
+            if warning.is_blinking:
+                warning.update_blink(dt)
     
     def render(self) -> Dict[str, Any]:
         """
@@ -580,25 +694,47 @@ class HUD:
     
     def get_gas_display(self) -> str:
         """获取气体显示文本"""
-        return f"GAS: {self._current_data.gas_level:.0f}/{self._current_data.max_gas:.0f}"
+        text = self._display_texts.get('gas')
+        if text is None:
+            data = self._current_data
+            text = f"GAS: {data.gas_level:.0f}/{data.max_gas:.0f}"
+            self._display_texts['gas'] = text
+        return text
     
     def get_blade_display(self) -> str:
         """获取刀刃显示文本"""
-        return f"BLADE: {self._current_data.blade_count}/{self._current_data.max_blades}"
+        text = self._display_texts.get('blade')
+        if text is None:
+            data = self._current_data
+            text = f"BLADE: {data.blade_count}/{data.max_blades}"
+            self._display_texts['blade'] = text
+        return text
     
     def get_health_display(self) -> str:
         """获取生命值显示文本"""
-        return f"HP: {self._current_data.health:.0f}/{self._current_data.max_health:.0f}"
+        text = self._display_texts.get('health')
+        if text is None:
+            data = self._current_data
+            text = f"HP: {data.health:.0f}/{data.max_health:.0f}"
+            self._display_texts['health'] = text
+        return text
     
     def get_combo_display(self) -> str:
         """获取连击显示文本"""
-        if self._current_data.combo_count > 0:
-            return f"COMBO x{self._current_data.combo_count}"
-        return ""
+        text = self._display_texts.get('combo')
+        if text is None:
+            count = self._current_data.combo_count
+            text = f"COMBO x{count}" if count > 0 else ""
+            self._display_texts['combo'] = text
+        return text
     
     def get_score_display(self) -> str:
         """获取分数显示文本"""
-        return f"SCORE: {self._current_data.total_score:,}"
+        text = self._display_texts.get('score')
+        if text is None:
+            text = f"SCORE: {self._current_data.total_score:,}"
+            self._display_texts['score'] = text
+        return text
     
     def is_low_gas_warning_active(self) -> bool:
         """
@@ -4,12 +4,17 @@
 Requirements: 8.2, 8.3
 """
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List, Tuple, Callable
+from typing import Optional, Dict, Any, List, Mapping, NamedTuple, Sequence, Tuple, Callable
 from enum import Enum
+from types import MappingProxyType
 import math
 import random
 
 
+# 所有特效共享的随机数生成器
+_RNG = random.Random()
+
+
 class EffectType(Enum):
     """特效类型"""
     SPEED_LINES = "speed_lines"
@@ -64,9 +69,12 @@ class SpeedLine:
     active: bool = True
 
 
-@dataclass
-class SteamParticle:
-    """蒸汽粒子数据"""
+class SteamParticle(NamedTuple):
+    """
+    蒸汽粒子数据(只读快照)
+    
+    粒子实际按列存储在 SteamParticleSystem 中, 仅在调用方请求单个粒子视图时生成。
+    """
     x: float
     y: float
     z: float
@@ -118,25 +126,26 @@ class SpeedLineEffect:
         """生成速度线"""
         self._lines.clear()
         line_count = int(self.config.line_count * self._intensity)
+        uniform = _RNG.uniform
         
         for _ in range(line_count):
             # 在屏幕边缘随机生成速度线
-            angle = random.uniform(0, 2 * math.pi)
-            radius = random.uniform(0.5, self.config.spawn_radius)
+            angle = uniform(0, 2 * math.pi)
+            radius = uniform(0.5, self.config.spawn_radius)
             
             start_x = math.cos(angle) * radius
             start_y = math.sin(angle) * radius
             
             # 速度线指向屏幕中心
             line_angle = angle + math.pi
-            length = random.uniform(self.config.min_length, self.config.max_length)
+            length = uniform(self.config.min_length, self.config.max_length)
             
             line = SpeedLine(
                 start_x=start_x,
                 start_y=start_y,
                 angle=line_angle,
                 length=length * self._intensity,
-                alpha=random.uniform(0.5, 1.0)
+                alpha=uniform(0.5, 1.0)
             )
             self._lines.append(line)
     
@@ -156,15 +165,16 @@ class SpeedLineEffect:
             self._lines = [l for l in self._lines if l.active]
             return
         
-        # 更新现有速度线
+        # 更新现有速度线(向中心移动)
+        shrink = 1.0 - 2.0 * dt
         for line in self._lines:
-            # 速度线向中心移动
-            move_speed = 2.0 * dt
-            line.start_x *= (1.0 - move_speed)
-            line.start_y *= (1.0 - move_speed)
+            x = line.start_x * shrink
+            y = line.start_y * shrink
+            line.start_x = x
+            line.start_y = y
             
-            # 检查是否到达中心
-            if abs(line.start_x) < 0.1 and abs(line.start_y) < 0.1:
+            # 检查是否到达中心(平方距离比较, 半径0.1)
+            if x * x + y * y < 0.01:
                 line.active = False
         
         # 移除不活跃的速度线
@@ -176,15 +186,16 @@ class SpeedLineEffect:
     
     def _spawn_single_line(self) -> None:
         """生成单条速度线"""
-        angle = random.uniform(0, 2 * math.pi)
+        uniform = _RNG.uniform
+        angle = uniform(0, 2 * math.pi)
         radius = self.config.spawn_radius
         
         line = SpeedLine(
             start_x=math.cos(angle) * radius,
             start_y=math.sin(angle) * radius,
             angle=angle + math.pi,
-            length=random.uniform(self.config.min_length, self.config.max_length) * self._intensity,
-            alpha=random.uniform(0.5, 1.0)
+            length=uniform(self.config.min_length, self.config.max_length) * self._intensity,
+            alpha=uniform(0.5, 1.0)
         )
         self._lines.append(line)
     
@@ -225,16 +236,17 @@ class MotionBlurEffect:
         self._velocity = (0.0, 0.0, 0.0)
         self._blur_direction = (0.0, 0.0)
     
-    def update(self, velocity: Tuple[float, float, float], dt: float) -> None:
+    def update(self, velocity: Sequence[float], dt: float) -> None:
         """
         根据速度更新运动模糊
         
         Args:
-            velocity: 当前速度向量 (x, y, z)
+            velocity: 当前速度向量 (x, y, z), 可以是元组或可复用的列表缓冲区
             dt: 时间增量(秒)
         """
-        self._velocity = velocity
-        speed = math.sqrt(velocity[0]**2 + velocity[1]**2 + velocity[2]**2)
+        vx, vy, vz = velocity
+        self._velocity = (vx, vy, vz)
+        speed = math.sqrt(vx * vx + vy * vy + vz * vz)
         
         # 计算模糊强度
         if speed > self.config.velocity_threshold:
@@ -253,8 +265,8 @@ class MotionBlurEffect:
         if self.config.direction_based and speed > 0.1:
             # 将3D速度投影到2D屏幕空间
             self._blur_direction = (
-                velocity[0] / speed,
-                velocity[1] / speed
+                vx / speed,
+                vy / speed
             )
     
     def get_blur_params(self) -> Dict[str, Any]:
@@ -284,10 +296,324 @@ class MotionBlurEffect:
         self.config.velocity_threshold = max(0.1, threshold)
 
 
+def _integrate_steam(columns: Tuple[List, ...], count: int, dt: float,
+                     color_end: Tuple[float, float, float, float],
+                     color_delta: Tuple[float, float, float, float],
+                     effect_counts: Optional[Dict[int, int]] = None) -> int:
+    """
+    蒸汽粒子积分内核
+    
+    原地推进前 count 个粒子一帧, 并在同一次遍历中写出粒子的渲染颜色;
+    过期粒子与末尾存活粒子交换槽位。
+    只依赖按列存储的数值数据, 不访问任何特效对象。
+    
+    Args:
+        columns: (x, y, z, vx, vy, vz, size, life, max_life, alpha, r, g, b, a, ...)
+            属性列, 前14列参与计算, 其后的附加列(如所属效果ID)只随粒子一起交换
+        count: 当前存活粒子数
+        dt: 时间增量(秒)
+        color_end: 结束颜色
+        color_delta: 起始颜色与结束颜色之差
+        effect_counts: 可选, 效果ID -> 存活粒子数; 给出时第15列为所属效果ID,
+            粒子过期时原地扣减对应计数, 计数归零的效果被移除
+        
+    Returns:
+        int: 更新后的存活粒子数
+    """
+    (xs, ys, zs, vxs, vys, vzs, sizes, lifes, maxlifes, alphas,
+     rs, gs, bs, as_) = columns[:14]
+    er, eg, eb, ea = color_end
+    dr, dg, db, da = color_delta
+    grow = 0.5 * dt
+    effects = columns[14] if effect_counts is not None else None
+    
+    i = 0
+    while i < count:
+        # 更新位置
+        vx = vxs[i]
+        vz = vzs[i]
+        xs[i] += vx * dt
+        ys[i] += vys[i] * dt
+        zs[i] += vz * dt
+        
+        # 粒子逐渐变大(蒸汽扩散)
+        sizes[i] += grow
+        
+        # 速度逐渐减慢
+        vxs[i] = vx * 0.98
+        vzs[i] = vz * 0.98
+        
+        # 更新生命周期, 透明度随生命周期衰减
+        life = lifes[i] - dt
+        lifes[i] = life
+        ratio = life / maxlifes[i]
+        alphas[i] = ratio
+        
+        # 颜色在起始颜色与结束颜色之间插值, 写入渲染颜色列
+        rs[i] = er + dr * ratio
+        gs[i] = eg + dg * ratio
+        bs[i] = eb + db * ratio
+        as_[i] = (ea + da * ratio) * ratio
+        
+        # 检查是否过期: 与最后一个存活粒子交换槽位, 保持存活粒子连续
+        if life <= 0:
+            if effects is not None:
+                effect_id = effects[i]
+                remaining = effect_counts[effect_id] - 1
+                if remaining:
+                    effect_counts[effect_id] = remaining
+                else:
+                    del effect_counts[effect_id]
+            count -= 1
+            for column in columns:
+                column[i] = column[count]
+            continue
+        i += 1
+    
+    return count
+
+
+class SteamParticleSystem:
+    """
+    蒸汽粒子系统
+    多个蒸汽效果的粒子共用一组按列存储(SoA)的属性, 每个粒子记录所属效果ID,
+    一次积分即可推进所有效果
+    Requirements: 8.3
+    """
+    
+    # 默认配置的起止颜色及其差值, 所有实例共享
+    _DEFAULT_COLOR_START = SteamConfig.color_start
+    _DEFAULT_COLOR_END = SteamConfig.color_end
+    _DEFAULT_COLOR_DELTA = tuple(
+        start - end for start, end in zip(SteamConfig.color_start, SteamConfig.color_end)
+    )
+    
+    def __init__(self, config: Optional[SteamConfig] = None):
+        """
+        初始化蒸汽粒子系统
+        
+        Args:
+            config: 蒸汽配置
+        """
+        self.config = config if config else SteamConfig()
+        # 粒子属性按列存储, 前 _count 个槽位为存活粒子, 槽位跨多次生成复用
+        self._p_x: List[float] = []
+        self._p_y: List[float] = []
+        self._p_z: List[float] = []
+        self._p_vx: List[float] = []
+        self._p_vy: List[float] = []
+        self._p_vz: List[float] = []
+        self._p_size: List[float] = []
+        self._p_life: List[float] = []
+        self._p_maxlife: List[float] = []
+        self._p_alpha: List[float] = []
+        # 渲染颜色列, 由积分内核在更新时一并写出
+        self._p_r: List[float] = []
+        self._p_g: List[float] = []
+        self._p_b: List[float] = []
+        self._p_a: List[float] = []
+        self._p_effect: List[int] = []
+        self._columns = (
+            self._p_x, self._p_y, self._p_z,
+            self._p_vx, self._p_vy, self._p_vz,
+            self._p_size, self._p_life, self._p_maxlife, self._p_alpha,
+            self._p_r, self._p_g, self._p_b, self._p_a,
+            self._p_effect
+        )
+        self._capacity = 0
+        self._count = 0
+        # 效果ID -> 存活粒子数
+        self._effect_counts: Dict[int, int] = {}
+        self._effect_counts_view: Mapping[int, int] = MappingProxyType(self._effect_counts)
+        self._ensure_capacity(self.config.particle_count)
+        
+        # 颜色插值写成 end + (start - end) * ratio, 两端差值只算一次;
+        # 使用默认颜色时直接共享类级别的预计算结果
+        color_start = self.config.color_start
+        color_end = self.config.color_end
+        if color_start == self._DEFAULT_COLOR_START and color_end == self._DEFAULT_COLOR_END:
+            self._color_end = self._DEFAULT_COLOR_END
+            self._color_delta = self._DEFAULT_COLOR_DELTA
+        else:
+            self._color_end = color_end
+            self._color_delta = tuple(start - end for start, end in zip(color_start, color_end))
+    
+    def _ensure_capacity(self, capacity: int) -> None:
+        """
+        确保各属性列至少有指定数量的槽位
+        
+        Args:
+            capacity: 需要的槽位数量
+        """
+        extra = capacity - self._capacity
+        if extra <= 0:
+            return
+        for column in self._columns:
+            column.extend([0.0] * extra)
+        self._capacity = capacity
+    
+    def spawn(self, position: Tuple[float, float, float],
+              scale: float = 1.0, effect_id: int = 0) -> int:
+        """
+        在指定位置追加一组蒸汽粒子
+        
+        Args:
+            position: 生成位置 (x, y, z)
+            scale: 效果缩放(基于巨人大小)
+            effect_id: 粒子所属的效果ID
+            
+        Returns:
+            int: 生成的粒子数量
+        """
+        particle_count = int(self.config.particle_count * scale)
+        if particle_count <= 0:
+            return 0
+        
+        start = self._count
+        end = start + particle_count
+        self._ensure_capacity(end)
+        
+        # 循环外取出配置, 随机数直接由 random() 线性映射到各区间
+        rand = _RNG.random
+        px, py, pz = position
+        min_size = self.config.min_size
+        size_span = self.config.max_size - min_size
+        spread = self.config.spread_speed
+        rise = self.config.rise_speed
+        lifetime = self.config.lifetime
+        
+        xs, ys, zs = self._p_x, self._p_y, self._p_z
+        vxs, vys, vzs = self._p_vx, self._p_vy, self._p_vz
+        sizes = self._p_size
+        
+        for i in range(start, end):
+            # 在原点周围随机生成粒子
+            xs[i] = px + (rand() * 2.0 - 1.0) * scale
+            ys[i] = py + rand() * 2.0 * scale
+            zs[i] = pz + (rand() * 2.0 - 1.0) * scale
+            sizes[i] = (min_size + rand() * size_span) * scale
+            
+            # 随机速度(主要向上)
+            vxs[i] = (rand() * 2.0 - 1.0) * spread
+            vys[i] = (0.5 + rand() * 0.5) * rise
+            vzs[i] = (rand() * 2.0 - 1.0) * spread
+        
+        self._p_life[start:end] = [lifetime] * particle_count
+        self._p_maxlife[start:end] = [lifetime] * particle_count
+        self._p_alpha[start:end] = [1.0] * particle_count
+        sr, sg, sb, sa = self.config.color_start
+        self._p_r[start:end] = [sr] * particle_count
+        self._p_g[start:end] = [sg] * particle_count
+        self._p_b[start:end] = [sb] * particle_count
+        self._p_a[start:end] = [sa] * particle_count
+        self._p_effect[start:end] = [effect_id] * particle_count
+        
+        self._count = end
+        self._effect_counts[effect_id] = self._effect_counts.get(effect_id, 0) + particle_count
+        return particle_count
+    
+    def update(self, dt: float) -> None:
+        """
+        更新所有蒸汽粒子
+        
+        Args:
+            dt: 时间增量(秒)
+        """
+        if self._count == 0:
+            return
+        
+        # 过期粒子的效果计数由内核在交换槽位时原地扣减
+        self._count = _integrate_steam(self._columns, self._count, dt,
+                                       self._color_end, self._color_delta,
+                                       self._effect_counts)
+    
+    def clear(self) -> None:
+        """清除所有粒子(保留槽位供复用)"""
+        self._count = 0
+        self._effect_counts.clear()
+    
+    def has_effect(self, effect_id: int) -> bool:
+        """检查指定效果是否仍有存活粒子"""
+        return effect_id in self._effect_counts
+    
+    def get_effect_count(self) -> int:
+        """获取仍有存活粒子的效果数量"""
+        return len(self._effect_counts)
+    
+    @property
+    def effect_counts(self) -> Mapping[int, int]:
+        """效果ID -> 存活粒子数(只读视图, 随粒子更新)"""
+        return self._effect_counts_view
+    
+    def get_particle_count(self) -> int:
+        """获取当前粒子数量"""
+        return self._count
+    
+    def get_particles(self) -> List[SteamParticle]:
+        """
+        获取当前所有粒子
+        
+        粒子数据按列存储, 此方法按需组装成 SteamParticle 快照,
+        渲染路径应优先使用 get_particle_colors 等批量接口。
+        """
+        return [
+            SteamParticle(
+                x=self._p_x[i],
+                y=self._p_y[i],
+                z=self._p_z[i],
+                size=self._p_size[i],
+                velocity_x=self._p_vx[i],
+                velocity_y=self._p_vy[i],
+                velocity_z=self._p_vz[i],
+                lifetime=self._p_life[i],
+                max_lifetime=self._p_maxlife[i],
+                alpha=self._p_alpha[i]
+            )
+            for i in range(self._count)
+        ]
+    
+    def get_particle_color(self, particle: SteamParticle) -> Tuple[float, float, float, float]:
+        """
+        获取粒子当前颜色(基于生命周期插值)
+        
+        Args:
+            particle: 蒸汽粒子
+            
+        Returns:
+            Tuple: RGBA颜色值
+        """
+        life_ratio = particle.lifetime / particle.max_lifetime
+        
+        # 在起始颜色和结束颜色之间插值
+        er, eg, eb, ea = self._color_end
+        dr, dg, db, da = self._color_delta
+        return (
+            er + dr * life_ratio,
+            eg + dg * life_ratio,
+            eb + db * life_ratio,
+            (ea + da * life_ratio) * particle.alpha
+        )
+    
+    def get_particle_colors(self) -> List[Tuple[float, float, float, float]]:
+        """
+        批量获取所有存活粒子的当前颜色
+        
+        颜色已在 update 的同一次遍历中算好, 这里只读取颜色列,
+        与 get_particles() 的顺序一致。渲染路径应使用此方法而非逐个调用
+        get_particle_color。
+        
+        Returns:
+            List: 每个粒子的RGBA颜色值
+        """
+        count = self._count
+        return list(zip(self._p_r[:count], self._p_g[:count],
+                        self._p_b[:count], self._p_a[:count]))
+
+
 class SteamDissolutionEffect:
     """
     蒸汽消散特效
-    巨人死亡时的蒸汽消散效果
+    巨人死亡时的蒸汽消散效果, 单个效果独占一个粒子系统
     Requirements: 8.3
     """
     
@@ -299,7 +625,7 @@ class SteamDissolutionEffect:
             config: 蒸汽配置
         """
         self.config = config if config else SteamConfig()
-        self._particles: List[SteamParticle] = []
+        self._system = SteamParticleSystem(self.config)
         self._active = False
         self._origin = (0.0, 0.0, 0.0)
     
@@ -314,34 +640,8 @@ class SteamDissolutionEffect:
         """
         self._active = True
         self._origin = position
-        self._particles.clear()
-        
-        particle_count = int(self.config.particle_count * scale)
-        
-        for _ in range(particle_count):
-            # 在原点周围随机生成粒子
-            offset_x = random.uniform(-1.0, 1.0) * scale
-            offset_y = random.uniform(0.0, 2.0) * scale
-            offset_z = random.uniform(-1.0, 1.0) * scale
-            
-            # 随机速度(主要向上)
-            vel_x = random.uniform(-1.0, 1.0) * self.config.spread_speed
-            vel_y = random.uniform(0.5, 1.0) * self.config.rise_speed
-            vel_z = random.uniform(-1.0, 1.0) * self.config.spread_speed
-            
-            particle = SteamParticle(
-                x=position[0] + offset_x,
-                y=position[1] + offset_y,
-                z=position[2] + offset_z,
-                size=random.uniform(self.config.min_size, self.config.max_size) * scale,
-                velocity_x=vel_x,
-                velocity_y=vel_y,
-                velocity_z=vel_z,
-                lifetime=self.config.lifetime,
-                max_lifetime=self.config.lifetime,
-                alpha=1.0
-            )
-            self._particles.append(particle)
+        self._system.clear()
+        self._system.spawn(position, scale)
     
     def update(self, dt: float) -> None:
         """
@@ -353,43 +653,15 @@ class SteamDissolutionEffect:
         if not self._active:
             return
         
-        for particle in self._particles:
-            if not particle.active:
-                continue
-            
-            # 更新位置
-            particle.x += particle.velocity_x * dt
-            particle.y += particle.velocity_y * dt
-            particle.z += particle.velocity_z * dt
-            
-            # 粒子逐渐变大(蒸汽扩散)
-            particle.size += 0.5 * dt
-            
-            # 速度逐渐减慢
-            particle.velocity_x *= 0.98
-            particle.velocity_z *= 0.98
-            
-            # 更新生命周期
-            particle.lifetime -= dt
-            
-            # 计算透明度(基于生命周期)
-            life_ratio = particle.lifetime / particle.max_lifetime
-            particle.alpha = life_ratio
-            
-            # 检查是否过期
-            if particle.lifetime <= 0:
-                particle.active = False
-        
-        # 移除不活跃的粒子
-        self._particles = [p for p in self._particles if p.active]
+        self._system.update(dt)
         
         # 如果所有粒子都消失,停用效果
-        if len(self._particles) == 0:
+        if self._system.get_particle_count() == 0:
             self._active = False
     
     def get_particles(self) -> List[SteamParticle]:
-        """获取当前所有粒子"""
-        return self._particles.copy()
+        """获取当前所有粒子(按需组装的快照)"""
+        return self._system.get_particles()
     
     def is_active(self) -> bool:
         """检查效果是否激活"""
@@ -397,7 +669,7 @@ class SteamDissolutionEffect:
     
     def get_particle_count(self) -> int:
         """获取当前粒子数量"""
-        return len(self._particles)
+        return self._system.get_particle_count()
     
     def get_particle_color(self, particle: SteamParticle) -> Tuple[float, float, float, float]:
         """
@@ -409,15 +681,11 @@ class SteamDissolutionEffect:
         Returns:
             Tuple: RGBA颜色值
         """
-        life_ratio = particle.lifetime / particle.max_lifetime
-        
-        # 在起始颜色和结束颜色之间插值
-        r = self.config.color_start[0] * life_ratio + self.config.color_end[0] * (1 - life_ratio)
-        g = self.config.color_start[1] * life_ratio + self.config.color_end[1] * (1 - life_ratio)
-        b = self.config.color_start[2] * life_ratio + self.config.color_end[2] * (1 - life_ratio)
-        a = self.config.color_start[3] * life_ratio + self.config.color_end[3] * (1 - life_ratio)
-        
-        return (r, g, b, a * particle.alpha)
+        return self._system.get_particle_color(particle)
+    
+    def get_particle_colors(self) -> List[Tuple[float, float, float, float]]:
+        """批量获取所有存活粒子的当前颜色"""
+        return self._system.get_particle_colors()
 
 
 class SlashTrailEffect:
@@ -426,9 +694,8 @@ class SlashTrailEffect:
     攻击时的刀光效果
     """
     
-    @dataclass
-    class TrailPoint:
-        """轨迹点"""
+    class TrailPoint(NamedTuple):
+        """轨迹点(只读快照, 由环形缓冲区中的数据按需生成)"""
         x: float
         y: float
         z: float
@@ -445,14 +712,22 @@ class SlashTrailEffect:
         """
         self.trail_length = trail_length
         self.fade_time = fade_time
-        self._points: List[SlashTrailEffect.TrailPoint] = []
+        # 轨迹点按列存储在预分配的环形缓冲区中, _head 指向最旧的点;
+        # 记录生成时刻而非逐点累加时间
+        self._xs: List[float] = [0.0] * trail_length
+        self._ys: List[float] = [0.0] * trail_length
+        self._zs: List[float] = [0.0] * trail_length
+        self._birth_times: List[float] = [0.0] * trail_length
+        self._head = 0
+        self._count = 0
+        self._clock = 0.0
         self._active = False
         self._color = (1.0, 1.0, 1.0, 0.8)
     
     def start_trail(self, color: Optional[Tuple[float, float, float, float]] = None) -> None:
         """开始记录轨迹"""
         self._active = True
-        self._points.clear()
+        self._clear_points()
         if color:
             self._color = color
     
@@ -466,35 +741,66 @@ class SlashTrailEffect:
         if not self._active:
             return
         
-        point = SlashTrailEffect.TrailPoint(
-            x=position[0],
-            y=position[1],
-            z=position[2],
-            alpha=1.0,
-            time=0.0
-        )
-        self._points.append(point)
+        capacity = len(self._birth_times)
+        if capacity == 0:
+            return
+        
+        # 缓冲区已满时覆盖最旧的点, 以此限制轨迹长度
+        if self._count < capacity:
+            index = (self._head + self._count) % capacity
+            self._count += 1
+        else:
+            index = self._head
+            self._head = (self._head + 1) % capacity
         
-        # 限制轨迹长度
-        if len(self._points) > self.trail_length:
-            self._points.pop(0)
+        self._xs[index] = position[0]
+        self._ys[index] = position[1]
+        self._zs[index] = position[2]
+        self._birth_times[index] = self._clock
     
     def end_trail(self) -> None:
         """结束轨迹记录"""
         self._active = False
     
+    def _clear_points(self) -> None:
+        """清空所有轨迹点(缓冲区保留复用)"""
+        self._head = 0
+        self._count = 0
+    
     def update(self, dt: float) -> None:
         """更新轨迹"""
-        for point in self._points:
-            point.time += dt
-            point.alpha = max(0.0, 1.0 - point.time / self.fade_time)
+        # 所有点以相同速率老化, 只需推进一次时钟
+        self._clock += dt
         
-        # 移除完全淡出的点
-        self._points = [p for p in self._points if p.alpha > 0]
+        # 移除完全淡出的点: 越旧的点越先淡出, 从 _head 开始前移即可
+        expire_before = self._clock - self.fade_time
+        birth_times = self._birth_times
+        capacity = len(birth_times)
+        while self._count and birth_times[self._head] <= expire_before:
+            self._head = (self._head + 1) % capacity
+            self._count -= 1
     
     def get_points(self) -> List['SlashTrailEffect.TrailPoint']:
-        """获取轨迹点"""
-        return self._points.copy()
+        """获取轨迹点(从旧到新)"""
+        clock = self._clock
+        fade_time = self.fade_time
+        capacity = len(self._birth_times)
+        points = []
+        for i in range(self._count):
+            index = (self._head + i) % capacity
+            age = clock - self._birth_times[index]
+            points.append(SlashTrailEffect.TrailPoint(
+                x=self._xs[index],
+                y=self._ys[index],
+                z=self._zs[index],
+                alpha=max(0.0, 1.0 - age / fade_time),
+                time=age
+            ))
+        return points
+    
+    def get_point_count(self) -> int:
+        """获取当前轨迹点数量"""
+        return self._count
     
     def is_active(self) -> bool:
         """检查是否正在记录"""
@@ -515,42 +821,47 @@ class VisualEffectsManager:
         """初始化特效管理器"""
         self.speed_lines = SpeedLineEffect()
         self.motion_blur = MotionBlurEffect()
-        self.steam_effects: Dict[int, SteamDissolutionEffect] = {}
+        # 所有巨人蒸汽效果共用一个粒子系统, 每帧一次积分
+        self.steam_system = SteamParticleSystem()
+        # 斩击轨迹, 键为单调递增且不会复用的轨迹ID
         self.slash_trails: Dict[int, SlashTrailEffect] = {}
         self._next_effect_id = 0
+        # 可复用的玩家速度缓冲区: 调用方每帧原地写入后传给 update, 无需新建元组
+        self.velocity_buffer: List[float] = [0.0, 0.0, 0.0]
     
-    def update(self, dt: float, player_velocity: Optional[Tuple[float, float, float]] = None) -> None:
+    def update(self, dt: float, player_velocity: Optional[Sequence[float]] = None) -> None:
         """
         更新所有特效
         
         Args:
             dt: 时间增量(秒)
-            player_velocity: 玩家速度(用于速度相关特效)
+            player_velocity: 玩家速度(用于速度相关特效), 可直接传入 velocity_buffer
         """
         # 更新速度线
         self.speed_lines.update(dt)
         
         # 更新运动模糊
-        if player_velocity:
+        if player_velocity is not None:
             self.motion_blur.update(player_velocity, dt)
         
-        # 更新蒸汽效果
-        expired_steam = []
-        for effect_id, effect in self.steam_effects.items():
-            effect.update(dt)
-            if not effect.is_active():
-                expired_steam.append(effect_id)
-        for effect_id in expired_steam:
-            del self.steam_effects[effect_id]
+        # 更新蒸汽效果(粒子全部消失的效果随之结束)
+        self.steam_system.update(dt)
         
         # 更新斩击轨迹
-        expired_trails = []
-        for trail_id, trail in self.slash_trails.items():
+        slash_trails = self.slash_trails
+        for trail_id, trail in list(slash_trails.items()):
             trail.update(dt)
-            if not trail.is_active() and len(trail.get_points()) == 0:
-                expired_trails.append(trail_id)
-        for trail_id in expired_trails:
-            del self.slash_trails[trail_id]
+            if not trail.is_active() and trail.get_point_count() == 0:
+                del slash_trails[trail_id]
+    
+    @property
+    def steam_effects(self) -> Mapping[int, int]:
+        """
+        仍在进行的蒸汽效果(只读)
+        
+        键为 spawn_titan_steam 返回的效果ID, 值为该效果的存活粒子数
+        """
+        return self.steam_system.effect_counts
     
     def activate_speed_lines(self, intensity: float = 1.0) -> None:
         """激活速度线效果"""
@@ -572,12 +883,9 @@ class VisualEffectsManager:
         Returns:
             int: 效果ID
         """
-        effect = SteamDissolutionEffect()
-        effect.spawn(position, titan_scale)
-        
         effect_id = self._next_effect_id
         self._next_effect_id += 1
-        self.steam_effects[effect_id] = effect
+        self.steam_system.spawn(position, titan_scale, effect_id)
         
         return effect_id
     
@@ -589,7 +897,7 @@ class VisualEffectsManager:
             color: 轨迹颜色
             
         Returns:
-            int: 轨迹ID
+            int: 轨迹ID(不会分配给之后创建的轨迹)
         """
         trail = SlashTrailEffect()
         trail.start_trail(color)
@@ -611,9 +919,10 @@ class VisualEffectsManager:
         Returns:
             bool: 是否成功添加
         """
-        if trail_id not in self.slash_trails:
+        trail = self.slash_trails.get(trail_id)
+        if trail is None:
             return False
-        self.slash_trails[trail_id].add_point(position)
+        trail.add_point(position)
         return True
     
     def end_slash_trail(self, trail_id: int) -> bool:
@@ -626,16 +935,17 @@ class VisualEffectsManager:
         Returns:
             bool: 是否成功结束
         """
-        if trail_id not in self.slash_trails:
+        trail = self.slash_trails.get(trail_id)
+        if trail is None:
             return False
-        self.slash_trails[trail_id].end_trail()
+        trail.end_trail()
         return True
     
     def get_active_effects_count(self) -> Dict[str, int]:
         """获取活跃特效数量统计"""
         return {
             'speed_lines': self.speed_lines.get_line_count(),
-            'steam_effects': len(self.steam_effects),
+            'steam_effects': self.steam_system.get_effect_count(),
             'slash_trails': len(self.slash_trails),
             'motion_blur_active': 1 if self.motion_blur.is_active() else 0
         }
@@ -643,5 +953,5 @@ class VisualEffectsManager:
     def clear_all_effects(self) -> None:
         """清除所有特效"""
         self.speed_lines.deactivate()
-        self.steam_effects.clear()
+        self.steam_system.clear()
         self.slash_trails.clear()
@@ -0,0 +1,95 @@
+"""
+AudioSystem 单元测试
+测试音量配置的存档序列化与读档
+"""
+import sys
+import os
+import json
+import struct
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+import presentation.audio as audio_module
+from presentation.audio import AudioSystem, AudioConfig
+
+
+def _make_audio_system() -> AudioSystem:
+    """创建带有非默认音量的音频系统"""
+    return AudioSystem(AudioConfig(
+        master_volume=0.7,
+        sfx_volume=0.25,
+        music_volume=0.5,
+        voice_volume=0.9
+    ))
+
+
+def _assert_same_volumes(config: AudioConfig, other: AudioConfig) -> None:
+    assert config.master_volume == other.master_volume
+    assert config.sfx_volume == other.sfx_volume
+    assert config.music_volume == other.music_volume
+    assert config.voice_volume == other.voice_volume
+
+
+class TestAudioConfigBytes:
+    """JSON 字节串配置存档测试类"""
+    
+    def test_round_trip(self):
+        """测试 save_config_bytes/load_config_bytes 往返一致"""
+        source = _make_audio_system()
+        data = source.save_config_bytes()
+        assert isinstance(data, bytes)
+        
+        target = AudioSystem()
+        target.load_config_bytes(data)
+        _assert_same_volumes(target.config, source.config)
+    
+    def test_round_trip_with_orjson(self, monkeypatch):
+        """测试使用 orjson 时的往返"""
+        orjson = pytest.importorskip('orjson')
+        monkeypatch.setattr(audio_module, '_json_dumps', orjson.dumps)
+        monkeypatch.setattr(audio_module, '_json_loads', orjson.loads)
+        
+        source = _make_audio_system()
+        target = AudioSystem()
+        target.load_config_bytes(source.save_config_bytes())
+        _assert_same_volumes(target.config, source.config)
+    
+    def test_round_trip_with_stdlib_json(self, monkeypatch):
+        """测试退回标准库 json 时的往返"""
+        monkeypatch.setattr(audio_module, '_json_dumps', audio_module._stdlib_json_dumps)
+        monkeypatch.setattr(audio_module, '_json_loads', json.loads)
+        
+        source = _make_audio_system()
+        data = source.save_config_bytes()
+        assert json.loads(data) == source.get_config_dict()
+        
+        target = AudioSystem()
+        target.load_config_bytes(data)
+        _assert_same_volumes(target.config, source.config)
+
+
+class TestAudioConfigPacked:
+    """定长二进制配置存档测试类"""
+    
+    def test_pack_round_trip(self):
+        """测试 pack_config/unpack_config 往返一致"""
+        source = _make_audio_system()
+        data = source.pack_config()
+        assert len(data) == 32
+        
+        target = AudioSystem()
+        target.unpack_config(data)
+        assert target.config.master_volume == 0.7
+        _assert_same_volumes(target.config, source.config)
+    
+    def test_unpack_wrong_length_raises(self):
+        """测试长度不正确的数据抛出 struct.error 且不修改配置"""
+        audio = _make_audio_system()
+        data = audio.pack_config()
+        
+        target = AudioSystem()
+        with pytest.raises(struct.error):
+            target.unpack_config(data[:-1])
+        with pytest.raises(struct.error):
+            target.unpack_config(data + b'\x00')
+        _assert_same_volumes(target.config, AudioSystem().config)
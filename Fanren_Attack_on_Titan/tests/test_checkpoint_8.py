@@ -5,6 +5,7 @@ Checkpoint 8 - 验证核心系统基本功能
 import pytest
 import sys
 import os
+import time
 
 # 添加项目根目录到路径
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -12,7 +13,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.game_manager import GameManager, GameState
 from gameplay.resource_system import ResourceSystem
 from gameplay.odm_system import ODMSystem, Vec3, Surface
-from gameplay.combat_system import CombatSystem, TitanHitbox, Vec3 as CombatVec3
+from gameplay.combat_system import CombatSystem, TitanHitbox, TitanSpatialHash, Vec3 as CombatVec3
 from data.save_system import SaveSystem, SaveData
 from content.character import Character, CharacterStats
 
@@ -31,6 +32,28 @@ class TestGameManager:
         assert gm.change_state(GameState.CHARACTER_SELECT) == True
         assert gm.current_state == GameState.CHARACTER_SELECT
     
+    def test_invalid_state_type_raises(self):
+        """测试非 GameState 参数抛出 ValueError"""
+        gm = GameManager()
+        with pytest.raises(ValueError):
+            gm.change_state("gameplay")
+        assert gm.current_state == GameState.MAIN_MENU
+    
+    def test_transitions_follow_valid_transitions(self):
+        """测试状态转换表只读, 且子类覆盖后按新表校验"""
+        with pytest.raises(TypeError):
+            GameManager.VALID_TRANSITIONS[GameState.MAIN_MENU] = frozenset()
+        
+        class MenuOnlyManager(GameManager):
+            VALID_TRANSITIONS = {GameState.MAIN_MENU: frozenset({GameState.RESULTS})}
+        
+        gm = MenuOnlyManager()
+        assert not gm.change_state(GameState.CHARACTER_SELECT)
+        assert gm.change_state(GameState.RESULTS)
+        assert not gm.change_state(GameState.MAIN_MENU)
+        with pytest.raises(TypeError):
+            MenuOnlyManager.VALID_TRANSITIONS[GameState.RESULTS] = frozenset()
+    
     def test_start_new_game(self):
         """测试开始新游戏"""
         gm = GameManager()
@@ -135,6 +158,148 @@ class TestCombatSystem:
         # 未命中后颈
         assert cs.check_nape_hit(titan, CombatVec3(0, 0, 0)) == False
     
+    def test_batch_nape_hit_detection(self):
+        """测试批量后颈命中检测与逐个检测一致"""
+        cs = CombatSystem()
+        titans = [
+            TitanHitbox(position=CombatVec3(x, 0, 0), nape_center=CombatVec3(0, 5, -1), nape_radius=1.0)
+            for x in range(4)
+        ]
+        points = [CombatVec3(0, 5, -1), CombatVec3(1, 5.5, -1), CombatVec3(0, 0, 0), CombatVec3(3, 6, -1)]
+        
+        expected = [cs.check_nape_hit(t, p) for t, p in zip(titans, points)]
+        assert cs.check_nape_hits_batch(titans, points) == expected == [True, True, False, True]
+    
+    def test_nape_position_follows_reassignment(self):
+        """测试重新赋值位置后后颈判定随之更新"""
+        titan = TitanHitbox(
+            position=CombatVec3(0, 0, 0),
+            nape_center=CombatVec3(0, 5, -1),
+            nape_radius=1.0
+        )
+        assert titan.is_point_in_nape(CombatVec3(0, 5, -1))
+        
+        titan.position = CombatVec3(10, 0, 0)
+        assert not titan.is_point_in_nape(CombatVec3(0, 5, -1))
+        assert titan.is_point_in_nape(CombatVec3(10, 5, -1))
+        assert titan.get_absolute_nape_position() == CombatVec3(10, 5, -1)
+        
+        titan.update_position(-4, 1, 2)
+        assert titan.is_point_in_nape(CombatVec3(-4, 6, 1))
+        assert titan.get_absolute_nape_xyz() == (-4, 6, 1)
+        assert titan.position == CombatVec3(-4, 1, 2)
+        assert titan.position is titan.position
+        assert titan.nape_dist_sq(-4, 8, 1) == 4.0
+        
+        # 标量移动后重新赋值后颈偏移, 仍按最新位置计算
+        titan.update_position(3, 0, 0)
+        titan.nape_center = CombatVec3(0, 2, 0)
+        assert titan.get_absolute_nape_xyz() == (3, 2, 0)
+        assert titan.position == CombatVec3(3, 0, 0)
+    
+    def test_spatial_hash_query_matches_brute_force(self):
+        """测试空间哈希查询包含所有范围内的巨人"""
+        titans = [
+            TitanHitbox(
+                position=CombatVec3(x * 3.7 - 20, 0, z * 2.9 - 15),
+                nape_center=CombatVec3(0, 5, -1),
+                nape_radius=1.0 + (x + z) % 3 * 0.5
+            )
+            for x in range(12) for z in range(12)
+        ]
+        grid = TitanSpatialHash(cell_size=4.0)
+        grid.rebuild(titans)
+        assert len(grid) == len(titans)
+        
+        for point in (CombatVec3(0, 5, 0), CombatVec3(-18.5, 4, -16), CombatVec3(7.3, 6, 9.1)):
+            candidates = set(map(id, grid.query(point, 2.0)))
+            for titan in titans:
+                nape = titan.get_absolute_nape_position()
+                reach = titan.nape_radius + 2.0
+                if point.distance_sq_to(nape) <= reach * reach:
+                    assert id(titan) in candidates
+    
+    def test_slash_finds_target_in_grid(self):
+        """测试未指定目标时从附近巨人中选取目标"""
+        cs = CombatSystem()
+        near = TitanHitbox(position=CombatVec3(0, 0, 0), nape_center=CombatVec3(0, 5, -1))
+        far = TitanHitbox(position=CombatVec3(50, 0, 0), nape_center=CombatVec3(0, 5, -1))
+        
+        cs.update_titan_grid([far, near])
+        result = cs.perform_slash_nearest(CombatVec3(0, 5, -1))
+        assert result.killed
+        assert not near.is_alive and far.is_alive
+        
+        # 范围内已没有存活巨人
+        assert cs.find_target(CombatVec3(0, 5, -1), cs.BLADE_RANGE) is None
+        
+        # 巨人移走且网格按帧更新后, 网格不会保留旧位置
+        other = TitanHitbox(position=CombatVec3(0, 0, 0), nape_center=CombatVec3(0, 5, -1))
+        cs.update_titan_grid([other])
+        other.update_position(40, 0, 0)
+        cs.update_titan_grid([other])
+        result = cs.perform_slash_nearest(CombatVec3(0, 5, -1))
+        assert not result.hit and other.is_alive
+    
+    def test_slash_without_target_misses(self):
+        """测试未指定目标的斩击不会命中网格中的巨人"""
+        cs = CombatSystem()
+        titan = TitanHitbox(position=CombatVec3(0, 0, 0), nape_center=CombatVec3(0, 5, -1))
+        cs.update_titan_grid([titan])
+        
+        result = cs.perform_slash(None, CombatVec3(0, 5, -1))
+        assert not result.hit
+        assert titan.is_alive
+        assert cs.blade_durability == cs.max_blade_durability
+    
+    def test_combo_window(self):
+        """测试连击时间窗口"""
+        cs = CombatSystem(combo_timeout=60.0)
+        for x in (0, 10):
+            titan = TitanHitbox(position=CombatVec3(x, 0, 0), nape_center=CombatVec3(0, 5, -1))
+            cs.perform_slash(titan, CombatVec3(x, 5, -1))
+        assert cs.combo_count == 2
+        
+        cs.update_combo(0.016)
+        assert cs.combo_count == 2
+        
+        cs._combo_timeout_ns = 0
+        cs.update_combo(0.016)
+        assert cs.combo_count == 0
+    
+    def test_combo_with_frame_clock(self):
+        """测试使用游戏循环传入的帧时间判定连击"""
+        cs = CombatSystem(combo_timeout=1.0)
+        
+        def slash(x, now_ns):
+            titan = TitanHitbox(position=CombatVec3(x, 0, 0), nape_center=CombatVec3(0, 5, -1))
+            return cs.perform_slash(titan, CombatVec3(x, 5, -1), now_ns=now_ns)
+        
+        cs.update_combo(now_ns=10_000_000_000)
+        assert slash(0, 10_000_000_000).killed
+        cs.update_combo(now_ns=10_500_000_000)
+        assert slash(10, 10_500_000_000).killed
+        assert cs.combo_count == 2
+        
+        # 超出连击窗口的击杀重新开始计数
+        assert slash(20, 12_000_000_000).killed
+        assert cs.combo_count == 1
+        
+        cs.update_combo(now_ns=13_100_000_000)
+        assert cs.combo_count == 0
+    
+    def test_combo_frame_clock_not_reused(self):
+        """测试帧时间不会沿用到之后未传入时间的击杀"""
+        cs = CombatSystem(combo_timeout=1.0)
+        cs.update_combo(now_ns=0)
+        
+        titan = TitanHitbox(position=CombatVec3(0, 0, 0), nape_center=CombatVec3(0, 5, -1))
+        before_ns = time.monotonic_ns()
+        cs.perform_slash(titan, CombatVec3(0, 5, -1))
+        
+        # 击杀时间来自单调时钟而不是之前传入的帧时间
+        assert cs._last_kill_ns >= before_ns
+    
     def test_attack_consumes_durability(self):
         """测试攻击消耗耐久度"""
         cs = CombatSystem()
@@ -158,6 +323,39 @@ class TestCombatSystem:
         )
         result = cs.perform_slash(titan, CombatVec3(0, 5, -1))
         assert result.hit == False
+    
+    def test_slash_sweep(self):
+        """测试横扫斩击结算多个巨人并只消耗一次耐久度"""
+        cs = CombatSystem()
+        titans = [
+            TitanHitbox(position=CombatVec3(x, 0, 0), nape_center=CombatVec3(0, 5, -1))
+            for x in (0, 10, 20)
+        ]
+        titans[2].is_alive = False
+        initial_durability = cs.blade_durability
+        
+        results = cs.perform_slash_sweep(
+            titans, [CombatVec3(0, 5, -1), CombatVec3(10, 0, 0), CombatVec3(20, 5, -1)]
+        )
+        
+        assert [r.hit for r in results] == [True, True, False]
+        assert [r.is_critical for r in results] == [True, False, False]
+        assert results[0].killed and not results[1].killed
+        assert cs.blade_durability == initial_durability - cs.durability_cost
+        assert cs.combo_count == 1
+    
+    def test_slash_sweep_validates_and_skips_misses(self):
+        """测试横扫参数长度不一致时报错, 全部未命中时不改变风格倍率"""
+        cs = CombatSystem()
+        titan = TitanHitbox(position=CombatVec3(0, 0, 0), nape_center=CombatVec3(0, 5, -1))
+        with pytest.raises(ValueError):
+            cs.perform_slash_sweep([titan], [])
+        
+        titan.is_alive = False
+        results = cs.perform_slash_sweep([titan], [CombatVec3(0, 5, -1)], attack_speed=1000.0)
+        assert not results[0].hit
+        assert cs.get_score_multiplier() == CombatSystem().get_score_multiplier()
+        assert cs.blade_durability == cs.max_blade_durability
 
 
 class TestSaveSystem:
@@ -215,3 +413,29 @@ class TestCharacter:
         Character.clear_cache()
         characters = Character.get_all_characters()
         assert len(characters) >= 12  # 至少12个104期成员
+    
+    def test_loaded_characters_are_independent(self):
+        """测试每次加载得到独立的角色对象"""
+        Character.clear_cache()
+        first = Character.load_from_json("eren")
+        first.stats.speed = 99.0
+        first.personality_traits.append("temporary")
+        first.relationships["temporary"] = "temporary"
+        
+        second = Character.load_from_json("eren")
+        assert second is not first
+        assert second.stats.speed != 99.0
+        assert "temporary" not in second.personality_traits
+        assert "temporary" not in second.relationships
+    
+    def test_get_all_characters_returns_copy(self):
+        """测试修改返回的角色列表不影响之后的调用"""
+        Character.clear_cache()
+        characters = Character.get_all_characters()
+        count = len(characters)
+        characters.pop()
+        characters.sort(key=lambda c: c.name, reverse=True)
+        
+        again = Character.get_all_characters()
+        assert len(again) == count
+        assert [c.id for c in again] == Character.get_all_character_ids()
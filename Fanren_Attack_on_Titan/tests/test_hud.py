@@ -0,0 +1,132 @@
+"""
+HUD 单元测试
+测试警告指示器状态切换、闪烁计时与显示文本缓存
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from presentation.ui.hud import (
+    HUD, HUDData, CounterDisplay, ComboDisplay, ScoreDisplay,
+    WarningIndicator, WarningType
+)
+
+
+class TestWarningIndicator:
+    """WarningIndicator 测试类"""
+    
+    def test_repeated_activate_keeps_blink_phase(self):
+        """测试已激活时再次激活不会重置闪烁状态"""
+        warning = WarningIndicator(warning_type=WarningType.LOW_GAS)
+        warning.activate()
+        assert warning.visible and warning.is_blinking
+        
+        warning.update_blink(0.6)
+        assert not warning.visible
+        warning.activate()
+        assert not warning.visible
+        assert warning.blink_timer == pytest.approx(0.1)
+    
+    def test_deactivate_resets_and_short_circuits(self):
+        """测试停用后清零计时, 未激活时再次停用不改变状态"""
+        warning = WarningIndicator(warning_type=WarningType.LOW_BLADE)
+        warning.activate()
+        warning.update_blink(0.3)
+        warning.deactivate()
+        assert not warning.visible and not warning.is_blinking
+        assert warning.blink_timer == 0.0
+        
+        warning.deactivate()
+        assert not warning.visible and not warning.is_blinking
+        
+        # 未激活时不推进闪烁
+        warning.update_blink(1.0)
+        assert not warning.visible and warning.blink_timer == 0.0
+    
+    def test_blink_timer_carries_remainder(self):
+        """测试闪烁计时扣除整段间隔, 余量保留到下一周期"""
+        warning = WarningIndicator()
+        warning.activate()
+        warning.update_blink(0.4)
+        assert warning.visible
+        warning.update_blink(0.4)
+        assert not warning.visible
+        assert warning.blink_timer == pytest.approx(0.3)
+        warning.update_blink(0.2)
+        assert warning.visible
+        assert warning.blink_timer == pytest.approx(0.0)
+    
+    def test_render_uses_cached_type_and_text(self):
+        """测试渲染数据中的警告类型与文本"""
+        data = WarningIndicator(warning_type=WarningType.CRITICAL_HEALTH).render()
+        assert data['warning_type'] == 'critical_health'
+        assert data['text'] == "⚠ 生命危险!"
+
+
+class TestDisplayTextCache:
+    """显示文本缓存测试类"""
+    
+    def test_counter_text_follows_setter_and_fields(self):
+        """测试计数器文本随 set_value 和字段直接赋值刷新"""
+        counter = CounterDisplay(label="刀刃")
+        assert counter.get_display_text() == "刀刃: 0"
+        counter.set_value(3, 8)
+        assert counter.get_display_text() == "刀刃: 3/8"
+        
+        counter.value = 5
+        assert counter.get_display_text() == "刀刃: 5/8"
+        counter.max_value = None
+        assert counter.get_display_text() == "刀刃: 5"
+        assert counter.render()['display_text'] == "刀刃: 5"
+        assert counter.render()['value'] == 5
+    
+    def test_combo_text_follows_setter_and_field(self):
+        """测试连击文本随 set_combo 和字段直接赋值刷新"""
+        combo = ComboDisplay()
+        combo.set_combo(2)
+        assert combo.render()['display_text'] == "COMBO x2"
+        assert combo.show_animation and combo.visible
+        
+        combo.combo_count = 4
+        assert combo.render()['display_text'] == "COMBO x4"
+        combo.set_combo(0)
+        assert combo.render()['display_text'] == ""
+        assert not combo.visible
+    
+    def test_score_text_follows_setter_and_field(self):
+        """测试分数文本随 set_score 和字段直接赋值刷新"""
+        score = ScoreDisplay()
+        score.set_score(1200)
+        assert score.render()['display_text'] == "SCORE: 1,200"
+        score.score = 34567
+        assert score.render()['display_text'] == "SCORE: 34,567"
+    
+    def test_hud_display_texts_refresh_on_update(self):
+        """测试 HUD 显示文本在数据更新后重新生成"""
+        hud = HUD()
+        hud.update(HUDData(gas_level=40.0, blade_count=3, combo_count=2, total_score=1500))
+        assert hud.get_gas_display() == "GAS: 40/100"
+        assert hud.get_blade_display() == "BLADE: 3/8"
+        assert hud.get_combo_display() == "COMBO x2"
+        assert hud.get_score_display() == "SCORE: 1,500"
+        
+        hud.update(HUDData(gas_level=10.0, blade_count=1, combo_count=0, total_score=2500))
+        assert hud.get_gas_display() == "GAS: 10/100"
+        assert hud.get_blade_display() == "BLADE: 1/8"
+        assert hud.get_combo_display() == ""
+        assert hud.get_score_display() == "SCORE: 2,500"
+        assert hud.blade_counter.get_display_text() == "刀刃: 1/8"
+    
+    def test_hud_warnings_follow_data(self):
+        """测试 HUD 根据数据激活和停用警告"""
+        hud = HUD()
+        hud.update(HUDData(low_gas_warning=True, health=10.0))
+        assert hud.gas_warning.is_blinking and hud.health_warning.is_blinking
+        assert not hud.blade_warning.is_blinking
+        
+        hud.update_animations(0.6)
+        assert not hud.gas_warning.visible
+        hud.update(HUDData())
+        assert not hud.gas_warning.is_blinking and not hud.health_warning.is_blinking
+        assert hud.gas_warning.blink_timer == 0.0
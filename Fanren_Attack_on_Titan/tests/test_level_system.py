@@ -0,0 +1,198 @@
+"""
+LevelSystem 单元测试
+测试关卡加载、巨人生成与目标判定
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from content.level_system import (
+    LevelSystem, LevelMetadata, LevelState, LevelNotFoundError,
+    Objective, ObjectiveType
+)
+
+
+@pytest.fixture
+def level_system():
+    """使用默认数据文件的关卡系统"""
+    LevelSystem.set_data_file_path(None)
+    return LevelSystem()
+
+
+class TestLevelQueries:
+    """关卡查询测试类"""
+    
+    def test_level_info_is_cached_metadata(self, level_system):
+        """测试关卡信息返回缓存的元数据"""
+        info = level_system.get_level_info('trost_defense_2')
+        assert isinstance(info, LevelMetadata)
+        assert info is level_system.get_level_info('trost_defense_2')
+        assert level_system.get_level_info('no_such_level') is None
+    
+    def test_levels_by_chapter(self, level_system):
+        """测试按章节查询关卡"""
+        all_levels = level_system.get_all_levels()
+        chapter_id = all_levels[0].chapter_id
+        expected = [level.id for level in all_levels if level.chapter_id == chapter_id]
+        assert [level.id for level in level_system.get_levels_by_chapter(chapter_id)] == expected
+        assert level_system.get_levels_by_chapter('no_such_chapter') == []
+    
+    def test_level_lists_are_copies(self, level_system):
+        """测试修改返回的关卡列表不会影响缓存"""
+        all_levels = level_system.get_all_levels()
+        chapter_id = all_levels[0].chapter_id
+        chapter_count = len(level_system.get_levels_by_chapter(chapter_id))
+        
+        all_levels.clear()
+        level_system.get_levels_by_chapter(chapter_id).pop()
+        assert level_system.get_all_levels()
+        assert len(level_system.get_levels_by_chapter(chapter_id)) == chapter_count
+    
+    def test_clear_cache(self, level_system):
+        """测试清除缓存后重新解析"""
+        before = level_system.get_all_levels()
+        LevelSystem.clear_cache()
+        after = level_system.get_all_levels()
+        assert after is not before
+        assert [level.id for level in after] == [level.id for level in before]
+    
+    def test_unknown_level_raises(self, level_system):
+        """测试加载不存在的关卡"""
+        with pytest.raises(LevelNotFoundError):
+            level_system.load_level('no_such_level')
+        assert level_system.level_state == LevelState.NOT_LOADED
+
+
+class TestLevelProgress:
+    """关卡进度测试类"""
+    
+    def test_spawns_follow_delay(self, level_system):
+        """测试巨人按延迟依次生成"""
+        spawned = []
+        level_system.set_on_titan_spawn(lambda sp: spawned.append(sp.titan_type) or sp)
+        level_system.load_level('trost_defense_2')
+        
+        level_system.update(0.1)
+        assert spawned == ['normal_5m', 'normal_7m']
+        level_system.update(10.0)
+        assert spawned == ['normal_5m', 'normal_7m', 'normal_3m', 'abnormal_5m']
+        assert len(level_system.active_titans) == 4
+        
+        titan = next(iter(level_system.active_titans.values()))
+        level_system.on_titan_killed(titan)
+        assert len(level_system.active_titans) == 3
+        assert level_system.titans_killed == 1
+    
+    def test_kill_and_reach_complete_level(self, level_system):
+        """测试击杀与到达目标完成后关卡完成"""
+        results = []
+        level_system.set_on_level_complete(results.append)
+        level_system.load_level('trost_defense_2')
+        
+        for _ in range(8):
+            level_system.on_titan_killed()
+        level_system.update(0.1, [0.0, 0.0, 0.0])
+        assert level_system.objectives_completed == {'obj_1'}
+        
+        level_system.update(0.1, [105.0, 0.0, 80.0])
+        assert level_system.level_state == LevelState.COMPLETED
+        assert results and results[0]['success'] is True
+    
+    def test_reach_objective_accepts_2d_positions(self, level_system):
+        """测试二维玩家坐标和二维目标坐标不会导致到达判定出错"""
+        level_system.load_level('trost_defense_2')
+        level_system.update(0.1, [1.0, 2.0])
+        assert level_system.level_state == LevelState.ACTIVE
+        level_system.update(0.1, [105.0, 0.0])
+        assert 'obj_2' in level_system.objectives_completed
+        
+        # 二维目标坐标与三维玩家坐标比较时忽略高度
+        objective = Objective('obj', ObjectiveType.REACH, '', position=[3.0, 4.0], radius=1.0)
+        update = level_system._build_reach_updater(objective)
+        assert not update(0.0, [0.0, 0.0, 0.0])
+        assert update(0.0, [3.0, 4.0, 50.0])
+        
+        level_system.load_level('trost_defense_2')
+        assert level_system.current_level.objectives[1].position == [100, 0, 80]
+        level_system.update(0.1, [105.0, 0.0, 80.0])
+        assert 'obj_2' in level_system.objectives_completed
+    
+    def test_defeat_objective_completes_level(self, level_system):
+        """测试击败目标通过 complete_objective 完成后关卡完成"""
+        level_system.load_level('stohess_battle')
+        level_system.update(0.1)
+        assert level_system.level_state == LevelState.ACTIVE
+        
+        assert level_system.complete_objective('obj_1')
+        assert not level_system.complete_objective('obj_1')
+        level_system.update(0.1)
+        assert level_system.objectives_completed == {'obj_1'}
+        assert level_system.level_state == LevelState.COMPLETED
+    
+    def test_externally_completed_objectives_are_counted(self, level_system):
+        """测试外部直接标记 is_completed 的目标同样计入完成"""
+        level_system.load_level('beast_titan_battle')
+        objectives = {obj.id: obj for obj in level_system.current_level.objectives}
+        
+        objectives['obj_1'].is_completed = True
+        level_system.update(0.1)
+        assert level_system.level_state == LevelState.ACTIVE
+        
+        objectives['obj_2'].is_completed = True
+        level_system.update(0.1)
+        assert level_system.objectives_completed == {'obj_1', 'obj_2'}
+        assert level_system.level_state == LevelState.COMPLETED
+    
+    def test_complete_objective_counts_without_update(self, level_system):
+        """测试 complete_objective 完成全部目标后 check_objectives 立即返回 True"""
+        level_system.load_level('trost_defense_2')
+        assert level_system.complete_objective('obj_1')
+        assert not level_system.check_objectives()
+        assert level_system.complete_objective('obj_2')
+        assert level_system.check_objectives()
+        
+        # 已计入的目标在 update 中不会重复计数
+        level_system.update(0.1)
+        assert level_system._objectives_done == 2
+        assert level_system.level_state == LevelState.COMPLETED
+    
+    def test_flagged_objective_with_updater_counts_on_update(self, level_system):
+        """测试直接标记 is_completed 的带更新函数目标在下一次 update 中计入"""
+        level_system.load_level('trost_defense_2')
+        for obj in level_system.current_level.objectives:
+            obj.is_completed = True
+        assert not level_system.check_objectives()
+        level_system.update(0.1)
+        assert level_system.objectives_completed == {'obj_1', 'obj_2'}
+        assert level_system.level_state == LevelState.COMPLETED
+    
+    def test_objective_radius_reassignment(self):
+        """测试修改目标半径后不会留下过期的派生值"""
+        objective = Objective('obj', ObjectiveType.REACH, '', radius=10.0)
+        objective.radius = 30.0
+        assert objective == Objective('obj', ObjectiveType.REACH, '', radius=30.0)
+    
+    def test_damage_objective_tracks_target(self, level_system):
+        """测试伤害目标只统计对应目标的伤害"""
+        level_system.load_level('female_titan_capture')
+        level_system.on_damage_dealt(300.0, 'female_titan')
+        level_system.on_damage_dealt(300.0, 'other')
+        
+        progress = {p['id']: p for p in level_system.get_objective_progress()}
+        assert progress['obj_1']['current_progress'] == 300.0
+        assert progress['obj_1']['target_value'] == 500.0
+    
+    def test_protect_target_destroyed_fails_level(self, level_system):
+        """测试保护目标生命值过低时关卡失败"""
+        level_system.load_level('trost_boulder')
+        level_system.on_protect_target_damaged('eren_titan', 80.0)
+        assert level_system.level_state == LevelState.ACTIVE
+        level_system.on_protect_target_damaged('eren_titan', 10.0)
+        assert level_system.level_state == LevelState.FAILED
+    
+    def test_time_limit_fails_level(self, level_system):
+        """测试超时关卡失败"""
+        level_system.load_level('trost_defense_2')
+        level_system.update(481.0)
+        assert level_system.level_state == LevelState.FAILED
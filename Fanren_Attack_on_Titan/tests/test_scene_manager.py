@@ -13,13 +13,15 @@ import os
 import sys
 import tempfile
 import shutil
+import threading
+import time
 
 # 添加父目录到路径
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.scene_manager import (
     SceneManager, SceneType, SceneData, 
-    LoadingScreen, LoadingTask, LoadingState, LoadingProgress
+    LoadingScreen, LoadingTask, LoadingState, LoadingProgress, LoadingStage
 )
 from core.game_controller import GameController
 from core.game_manager import GameState
@@ -67,6 +69,27 @@ class TestSceneManager:
         assert sm.current_scene.scene_id == "test_level"
         assert sm.current_scene.params['difficulty'] == 1
     
+    def test_go_back_reuses_scene_data(self):
+        """测试返回上一场景时沿用原场景数据"""
+        sm = SceneManager()
+        sm.go_to_main_menu()
+        menu_scene = sm.current_scene
+        sm.go_to_character_select()
+        
+        assert sm.go_back()
+        assert sm.current_scene is menu_scene
+        assert sm.current_scene.to_dict()['params'] == {}
+    
+    def test_scene_without_params_is_writable(self):
+        """测试未传入参数的场景拥有各自可写的参数字典"""
+        sm = SceneManager()
+        sm.go_to_main_menu()
+        menu_scene = sm.current_scene
+        menu_scene.params['selected'] = 1
+        
+        sm.go_to_character_select()
+        assert sm.current_scene.params == {}
+    
     def test_scene_info(self):
         """测试获取场景信息"""
         sm = SceneManager()
@@ -75,6 +98,86 @@ class TestSceneManager:
         info = sm.get_scene_info()
         assert info['current_scene']['scene_type'] == 'main_menu'
         assert not info['is_loading']
+    
+    def _run_until_loaded(self, sm, timeout=2.0):
+        """逐帧调用 update 直到加载结束"""
+        deadline = time.time() + timeout
+        while sm.is_loading and sm.loading_screen.state == LoadingState.LOADING:
+            assert time.time() < deadline, "加载超时"
+            sm.update()
+            time.sleep(0.001)
+    
+    def test_task_loaders_run_by_stage(self):
+        """测试按任务阶段分派的加载器"""
+        sm = SceneManager()
+        threads = {}
+        
+        def record(name):
+            def loader(scene):
+                assert scene.scene_id == "level_1"
+                threads[name] = threading.current_thread()
+            return loader
+        
+        sm.register_task_loader(SceneType.GAMEPLAY, "environment", record("environment"))
+        sm.register_task_loader(SceneType.GAMEPLAY, "titans", record("titans"))
+        sm.register_task_loader(SceneType.GAMEPLAY, "player", record("player"))
+        
+        sm.go_to_gameplay("level_1")
+        assert sm.is_loading
+        self._run_until_loaded(sm)
+        
+        assert sm.current_scene_type == SceneType.GAMEPLAY
+        assert not sm.is_loading
+        assert threads["player"] is threading.main_thread()
+        assert threads["environment"] is not threading.main_thread()
+        assert threads["titans"] is threading.main_thread()
+    
+    def test_thread_pool_created_lazily(self):
+        """测试线程池仅在分派 IO 任务时创建"""
+        sm = SceneManager()
+        sm.register_task_loader(SceneType.GAMEPLAY, "player", lambda scene: None)
+        sm.go_to_gameplay("level_1")
+        self._run_until_loaded(sm)
+        assert sm._io_pool is None
+        
+        sm.register_task_loader(SceneType.GAMEPLAY, "environment", lambda scene: None)
+        sm.go_to_gameplay("level_2")
+        self._run_until_loaded(sm)
+        assert sm._io_pool is not None
+        sm.shutdown()
+    
+    def test_task_loader_error(self):
+        """测试后台加载器出错"""
+        sm = SceneManager()
+        
+        def failing_loader(scene):
+            raise IOError("文件损坏")
+        
+        sm.register_task_loader(SceneType.GAMEPLAY, "environment", failing_loader)
+        sm.go_to_gameplay("level_1")
+        self._run_until_loaded(sm)
+        
+        assert sm.loading_screen.state == LoadingState.ERROR
+        assert sm.loading_screen.progress.error_message == "文件损坏"
+        assert sm.current_scene_type == SceneType.NONE
+    
+    def test_scene_loader_task_list(self):
+        """测试以任务列表注册场景加载器并关闭线程池"""
+        sm = SceneManager()
+        loaded = []
+        
+        sm.register_scene_loader(SceneType.CUTSCENE, [
+            ("assets", lambda scene: loaded.append("assets")),
+            ("dialogue", lambda scene: loaded.append("dialogue")),
+        ])
+        sm.go_to_cutscene("intro")
+        self._run_until_loaded(sm)
+        
+        assert sm.current_scene_type == SceneType.CUTSCENE
+        assert sorted(loaded) == ["assets", "dialogue"]
+        
+        sm.shutdown()
+        assert sm._io_pool is None
 
 
 class TestLoadingScreen:
@@ -159,6 +262,24 @@ class TestLoadingScreen:
         assert render_data['visible'] == True
         assert render_data['state'] == 'loading'
         assert len(render_data['tasks']) == 1
+    
+    def test_render_cache_refreshes_on_change(self):
+        """测试渲染数据在加载状态变化后刷新"""
+        ls = LoadingScreen()
+        ls.start_loading([LoadingTask("task1", "任务1"), LoadingTask("task2", "任务2")])
+        
+        first = ls.render()
+        assert ls.render() is first
+        
+        ls.complete_task("task1")
+        second = ls.render()
+        assert second is not first
+        assert second['progress']['tasks_completed'] == 1
+        assert second['tasks'][0]['completed'] is True
+        assert second['tasks'] is first['tasks']
+        
+        ls.set_task_error("task2", "失败")
+        assert ls.render()['tasks'][1]['error'] == "失败"
 
 
 class TestGameController:
@@ -267,6 +388,20 @@ class TestSceneData:
         assert data['scene_type'] == 'gameplay'
         assert data['scene_id'] == 'level_1'
         assert data['params']['difficulty'] == 2
+    
+    def test_to_dict_shares_params(self):
+        """测试场景数据字段不可重新赋值, to_dict 外层字典独立而 params 与场景共享"""
+        sd = SceneData(scene_type=SceneType.MAIN_MENU, params={'difficulty': 1})
+        with pytest.raises(AttributeError):
+            sd.scene_id = "other"
+        
+        data = sd.to_dict()
+        data['scene_id'] = "other"
+        assert sd.to_dict()['scene_id'] == ""
+        assert data['params'] is sd.params
+        
+        sd.params['difficulty'] = 2
+        assert sd.to_dict()['params'] == {'difficulty': 2}
 
 
 class TestLoadingProgress:
@@ -0,0 +1,135 @@
+"""
+VisualEffects 单元测试
+测试蒸汽粒子系统与斩击轨迹的核心功能
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from presentation.visual_effects import (
+    SteamConfig, SteamParticleSystem, SlashTrailEffect, VisualEffectsManager
+)
+
+
+class TestSteamParticleSystem:
+    """SteamParticleSystem 测试类"""
+    
+    def test_spawn_and_effect_counts(self):
+        """测试生成粒子并按效果ID统计"""
+        system = SteamParticleSystem(SteamConfig(particle_count=10))
+        assert system.spawn((0.0, 0.0, 0.0), 1.0, effect_id=1) == 10
+        assert system.spawn((5.0, 0.0, 0.0), 2.0, effect_id=2) == 20
+        
+        assert system.get_particle_count() == 30
+        assert system.get_effect_count() == 2
+        assert system.has_effect(1) and system.has_effect(2)
+    
+    def test_particles_expire(self):
+        """测试粒子生命周期结束后被移除"""
+        system = SteamParticleSystem(SteamConfig(particle_count=8, lifetime=1.0))
+        system.spawn((0.0, 0.0, 0.0), effect_id=0)
+        
+        system.update(0.5)
+        assert system.get_particle_count() == 8
+        system.update(0.6)
+        assert system.get_particle_count() == 0
+        assert not system.has_effect(0)
+    
+    def test_colors_fade_towards_end(self):
+        """测试粒子颜色随寿命向结束颜色插值"""
+        config = SteamConfig(particle_count=4, lifetime=2.0)
+        system = SteamParticleSystem(config)
+        system.spawn((0.0, 0.0, 0.0))
+        system.update(1.0)
+        
+        for particle, color in zip(system.get_particles(), system.get_particle_colors()):
+            assert color == pytest.approx(system.get_particle_color(particle))
+            assert color[3] < config.color_start[3]
+    
+    def test_effect_counts_follow_expiry(self):
+        """测试粒子过期时按效果扣减计数"""
+        system = SteamParticleSystem(SteamConfig(particle_count=6, lifetime=1.0))
+        system.spawn((0.0, 0.0, 0.0), effect_id=1)
+        system.update(0.5)
+        system.spawn((5.0, 0.0, 0.0), effect_id=2)
+        assert dict(system.effect_counts) == {1: 6, 2: 6}
+        
+        system.update(0.6)
+        assert dict(system.effect_counts) == {2: 6}
+        assert not system.has_effect(1)
+        with pytest.raises(TypeError):
+            system.effect_counts[3] = 1
+        
+        system.update(0.5)
+        assert dict(system.effect_counts) == {}
+        assert system.get_effect_count() == 0
+    
+    def test_particles_are_read_only(self):
+        """测试粒子快照为只读"""
+        system = SteamParticleSystem(SteamConfig(particle_count=1))
+        system.spawn((0.0, 0.0, 0.0))
+        particle = system.get_particles()[0]
+        with pytest.raises(AttributeError):
+            particle.x = 1.0
+
+
+class TestSlashTrailEffect:
+    """SlashTrailEffect 测试类"""
+    
+    def test_ring_buffer_keeps_newest_points(self):
+        """测试缓冲区满后覆盖最旧的点"""
+        trail = SlashTrailEffect(trail_length=3)
+        trail.start_trail()
+        for i in range(5):
+            trail.add_point((float(i), 0.0, 0.0))
+        
+        assert [p.x for p in trail.get_points()] == [2.0, 3.0, 4.0]
+    
+    def test_points_fade_out(self):
+        """测试轨迹点淡出后被移除"""
+        trail = SlashTrailEffect(fade_time=0.3)
+        trail.start_trail()
+        trail.add_point((0.0, 0.0, 0.0))
+        trail.update(0.1)
+        trail.add_point((1.0, 0.0, 0.0))
+        
+        trail.update(0.25)
+        points = trail.get_points()
+        assert len(points) == 1
+        assert points[0].x == 1.0
+        assert points[0].alpha == pytest.approx(1.0 - 0.25 / 0.3)
+
+
+class TestVisualEffectsManager:
+    """VisualEffectsManager 测试类"""
+    
+    def test_steam_effects_view(self):
+        """测试蒸汽效果只读视图"""
+        manager = VisualEffectsManager()
+        effect_id = manager.spawn_titan_steam((0.0, 0.0, 0.0))
+        assert effect_id in manager.steam_effects
+        assert manager.steam_effects[effect_id] == manager.steam_system.get_particle_count()
+        
+        manager.update(10.0)
+        assert effect_id not in manager.steam_effects
+    
+    def test_trail_ids_are_not_reused(self):
+        """测试结束并淡出的轨迹被移除, 且轨迹ID不会复用"""
+        manager = VisualEffectsManager()
+        trail_id = manager.create_slash_trail()
+        assert manager.add_slash_point(trail_id, (0.0, 0.0, 0.0))
+        assert manager.end_slash_trail(trail_id)
+        
+        manager.update(1.0)
+        assert manager.get_active_effects_count()['slash_trails'] == 0
+        assert trail_id not in manager.slash_trails
+        
+        new_id = manager.create_slash_trail()
+        assert new_id != trail_id
+        
+        # 旧ID不会操作到新轨迹
+        assert not manager.add_slash_point(trail_id, (1.0, 0.0, 0.0))
+        assert not manager.end_slash_trail(trail_id)
+        assert manager.slash_trails[new_id].is_active()
+        assert manager.slash_trails[new_id].get_point_count() == 0